@@ -12,20 +12,89 @@ References:
 - Government RFP format standards (FAR 15.210)
 """
 
+import atexit
+import os
 import re
+import sys
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import time
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import multiprocessing
 
 # Performance monitoring
 from src.utils.performance_monitor import get_monitor
 
+# Optional RE2 engine (google-re2) for guaranteed linear-time scans of whole documents
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Opt-in: with RFP_CHUNK_WORKERS > 1, sections of large documents are chunked in
+# worker processes (capped at MAX_CHUNK_WORKERS). The default of 1 keeps chunking
+# in-process. Workers are spawned, and spawn re-imports the parent's __main__
+# module in each of them: under src/server.py that re-runs load_dotenv and
+# setup_logging (extra handlers on the same log files) and imports the full
+# LightRAG stack once per worker, so only enable this where that cost is acceptable.
+MAX_CHUNK_WORKERS = 4
+CHUNK_WORKERS = max(1, min(int(os.getenv("RFP_CHUNK_WORKERS", "1")), MAX_CHUNK_WORKERS, os.cpu_count() or 1))
+PARALLEL_CHUNKING_MIN_CHARS = 200_000
+
+class _LinearPattern:
+    """
+    Case-insensitive hot-path pattern that runs on RE2 when it can
+    
+    RE2 matches in time linear in the input regardless of pattern shape, which
+    bounds the cost of scanning large or OCR-garbled documents. RE2's \\b and \\s
+    are ASCII-only, so it is used for ASCII text only; other text (and all text
+    when google-re2 is not installed) goes through the stdlib engine, keeping
+    results identical. Patterns must stay within the syntax both engines share
+    (no lookaround or backreferences).
+    """
+    __slots__ = ("_re", "_re2")
+    
+    def __init__(self, pattern: str):
+        self._re = re.compile(pattern, re.IGNORECASE)
+        self._re2 = re2.compile(f"(?i){pattern}") if re2 is not None else None
+    
+    def _engine(self, text: str):
+        return self._re2 if self._re2 is not None and text.isascii() else self._re
+    
+    def search(self, text: str):
+        return self._engine(text).search(text)
+    
+    def finditer(self, text: str):
+        return self._engine(text).finditer(text)
+
+
+# Fixed splitting/cleanup patterns, compiled once at import
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Page breaks in extracted text: form feeds and "Page N" / "Page N of M" footer lines
+_PAGE_BREAK_RE = re.compile(r'\f|^[ \t]*page[ \t]+\d+(?:[ \t]+of[ \t]+\d+)?[ \t]*$', re.IGNORECASE | re.MULTILINE)
+# Cross-reference cue words, matched case-insensitively without a lowercased copy
+_EVALUATION_CUE_RE = re.compile('evaluat', re.IGNORECASE)
+_INSTRUCTION_CUE_RE = re.compile('instruction', re.IGNORECASE)
+_CLIN_CUE_RE = re.compile('clin', re.IGNORECASE)
+_PERFORMANCE_CUE_RE = re.compile('performance', re.IGNORECASE)
+
+
+def _base_section(section_id: str) -> str:
+    """Base section letter of a section id (J-1, J-2 -> J)"""
+    return section_id.partition('-')[0]
+
+
+@dataclass(slots=True)
 class RFPSection:
     """Represents an identified RFP section with context"""
     section_id: str  # "A", "B", "C", "L", "M", "J-1", etc.
@@ -33,14 +102,13 @@ class RFPSection:
     content: str
     start_pos: int
     end_pos: int
-    subsections: List['RFPSubsection'] = None
+    subsections: List['RFPSubsection'] = field(default_factory=list)
     page_number: Optional[int] = None
     
     def __post_init__(self):
-        if self.subsections is None:
-            self.subsections = []
+        self.section_id = sys.intern(self.section_id)
 
-@dataclass 
+@dataclass(slots=True)
 class RFPSubsection:
     """Represents subsections within major sections"""
     subsection_id: str  # "C.3.1", "L.2.5", "M.1.a", etc.
@@ -50,7 +118,7 @@ class RFPSubsection:
     start_pos: int
     end_pos: int
 
-@dataclass
+@dataclass(slots=True)
 class ContextualChunk:
     """Enhanced chunk with RFP section context and relationships"""
     chunk_id: str
@@ -59,18 +127,36 @@ class ContextualChunk:
     section_title: str
     subsection_id: Optional[str] = None
     chunk_order: int = 0
-    relationships: List[str] = None  # Related section IDs
-    requirements: List[str] = None   # Identified requirements
+    relationships: List[str] = field(default_factory=list)  # Related section IDs
+    requirements: List[str] = field(default_factory=list)   # Identified requirements
     page_number: Optional[int] = None
-    metadata: Dict[str, Any] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    base_section: str = field(init=False, repr=False)  # "J" for "J-1"; derived from section_id
     
     def __post_init__(self):
-        if self.relationships is None:
-            self.relationships = []
-        if self.requirements is None:
-            self.requirements = []
-        if self.metadata is None:
-            self.metadata = {}
+        # Thousands of chunks share a handful of section ids/titles
+        self.section_id = sys.intern(self.section_id)
+        self.section_title = sys.intern(self.section_title)
+        self.base_section = sys.intern(_base_section(self.section_id))
+
+def _strip_inline_ignorecase(pattern: str) -> str:
+    """Drop a leading (?i) so the pattern can be embedded in a larger alternation"""
+    return pattern[4:] if pattern.startswith("(?i)") else pattern
+
+
+def _literal_prefix(pattern: str) -> str:
+    """
+    Lowercase literal every match of a header pattern starts with ("" if none)
+    
+    Reads the leading run of letters after any (?i) and ^, dropping the last one
+    if a quantifier makes it optional (e.g. "supplies?" -> "supplie").
+    """
+    pattern = _strip_inline_ignorecase(pattern).lstrip("^")
+    prefix = re.match(r"[a-z]*", pattern).group(0)
+    if prefix and pattern[len(prefix):len(prefix) + 1] in ("?", "*", "{"):
+        prefix = prefix[:-1]
+    return prefix
+
 
 class ShipleyRFPChunker:
     """
@@ -85,6 +171,44 @@ class ShipleyRFPChunker:
         self.relationship_mappings = self._build_relationship_mappings()
         self.requirement_patterns = self._build_requirement_patterns()
         
+        # Compile section header patterns once per chunker: id -> (main, [alternates])
+        self._section_regexes = {
+            section_id: (
+                re.compile(patterns["pattern"], re.MULTILINE),
+                [re.compile(alt, re.MULTILINE) for alt in patterns.get("alt_patterns", [])]
+            )
+            for section_id, patterns in self.section_patterns.items()
+        }
+        # Main A-M header patterns unioned into one alternation (one named group per
+        # section) so the document is scanned once. Each header starts with
+        # "section <letter>", so the alternatives can never overlap.
+        self._main_section_union = _LinearPattern(
+            "|".join(
+                f"(?P<{section_id}>{_strip_inline_ignorecase(patterns['pattern'])})"
+                for section_id, patterns in self.section_patterns.items()
+                if section_id != "J_ATTACHMENT"
+            )
+        )
+        # Literal every main header contains; documents without it skip the union scan
+        self._section_keyword_re = re.compile("section", re.IGNORECASE)
+        # Literal prefix of each alternate header pattern (id -> [prefix per alternate]);
+        # an alternate whose prefix is absent from the document cannot match
+        self._alt_literal_prefixes = {
+            section_id: [_literal_prefix(alt) for alt in patterns.get("alt_patterns", [])]
+            for section_id, patterns in self.section_patterns.items()
+        }
+        # All requirement indicators as one alternation, plus a sentence-level form
+        # that captures a whole [.!?]-delimited sentence containing an indicator
+        requirement_union = "|".join(
+            f"(?:{_strip_inline_ignorecase(pattern)})" for pattern in self.requirement_patterns
+        )
+        self._requirement_re = _LinearPattern(requirement_union)
+        self._requirement_sentence_re = _LinearPattern(
+            rf"(?:^|[.!?])([^.!?]*?(?:{requirement_union})[^.!?]*)"
+        )
+        # Subsection patterns depend on the parent section id; compiled on first use
+        self._subsection_regex_cache: Dict[str, Tuple[re.Pattern, List[re.Pattern]]] = {}
+        
     def _build_section_patterns(self) -> Dict[str, Dict[str, str]]:
         """Build regex patterns for identifying RFP sections"""
         return {
@@ -156,18 +280,19 @@ class ShipleyRFPChunker:
             },
             
             # J Attachments (common patterns)
+            # Titles are matched greedily to end of line as [^\n][^\r\n]* instead of a lazy (.+?)
             # Universal pattern: Match legitimate attachment designations, not random text fragments
             # Examples: "Attachment J-1", "Exhibit J.2", "Attachment JL-1", but NOT "Attachment Line Item"
             "J_ATTACHMENT": {
                 # Primary: "Attachment/Exhibit" followed by "J" + delimiter + alphanumeric designation
                 # Requires explicit delimiter (hyphen, period, or space) to avoid matching random words
-                "pattern": r"(?i)(?:attachment|exhibit)\s+j[\-\.\s]([a-z0-9]+(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*(.+?))?(?:\n|\r|$)",
+                "pattern": r"(?i)(?:attachment|exhibit)\s+j[\-\.\s]([a-z0-9]+(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*([^\n][^\r\n]*))?(?:\n|\r|$)",
                 "title": "J Attachment",
                 "alt_patterns": [
                     # Alt 1: "Section J Attachment" with designation
-                    r"(?i)section\s+j\s+attachment\s+([a-z0-9]+(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*(.+?))?(?:\n|\r|$)",
+                    r"(?i)section\s+j\s+attachment\s+([a-z0-9]+(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*([^\n][^\r\n]*))?(?:\n|\r|$)",
                     # Alt 2: Standalone "J-" with multi-char designation (prevents matching "J-Line" fragments)
-                    r"(?i)\bj[\-]([a-z0-9]{2,}(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*(.+?))?(?:\n|\r|$)"
+                    r"(?i)\bj[\-]([a-z0-9]{2,}(?:[\-\.][a-z0-9]+)*)(?:\s+[\-:]\s*([^\n][^\r\n]*))?(?:\n|\r|$)"
                 ]
             }
         }
@@ -215,28 +340,52 @@ class ShipleyRFPChunker:
         
         Returns list of RFPSection objects with content and metadata
         """
+        sections = [
+            self._build_section(document_text, section_match)
+            for section_match in self._find_section_matches(document_text)
+        ]
+        
+        logger.info(f"Identified {len(sections)} RFP sections: {[s.section_id for s in sections]}")
+        return sections
+    
+    def _find_section_matches(self, document_text: str) -> List[Dict[str, Any]]:
+        """
+        Locate section headers and the span each section covers, without extracting content
+        
+        Each entry has section_id, title, start, end (start of the next section
+        or end of document) and page_number, in document order.
+        """
         logger.info(f"🔍 Scanning document for RFP sections ({len(document_text):,} chars)...")
-        sections = []
         text_length = len(document_text)
         
         # Track all section matches with positions
         section_matches = []
         
+        # Lowercased copy for literal prefilters; only ASCII text lowercases without
+        # changing offsets or diverging from IGNORECASE matching
+        lowered = document_text.lower() if document_text.isascii() else None
+        
+        # Single pass over the document for every main section header
+        main_matches: Dict[str, List[re.Match]] = {}
+        if self._section_keyword_re.search(document_text):
+            for match in self._main_section_union.finditer(document_text):
+                main_matches.setdefault(match.lastgroup, []).append(match)
+        
         # Search for each section pattern
         for section_id, patterns in self.section_patterns.items():
             if section_id == "J_ATTACHMENT":
                 continue  # Handle J attachments separately
             
-            logger.info(f"   Searching for Section {section_id}...")
-                
             # Try main pattern first
-            main_pattern = patterns["pattern"]
-            matches = list(re.finditer(main_pattern, document_text, re.MULTILINE))
+            _, alt_regexes = self._section_regexes[section_id]
+            matches = main_matches.get(section_id, [])
             
             # Try alternative patterns if no main match
-            if not matches and "alt_patterns" in patterns:
-                for alt_pattern in patterns["alt_patterns"]:
-                    matches = list(re.finditer(alt_pattern, document_text, re.MULTILINE))
+            if not matches:
+                for alt_regex, prefix in zip(alt_regexes, self._alt_literal_prefixes[section_id]):
+                    if lowered is not None and prefix not in lowered:
+                        continue  # Literal prefilter: pattern cannot match
+                    matches = list(alt_regex.finditer(document_text))
                     if matches:
                         break
             
@@ -251,8 +400,7 @@ class ShipleyRFPChunker:
                 })
         
         # Handle J attachments separately (they can be numbered)
-        j_pattern = self.section_patterns["J_ATTACHMENT"]["pattern"]
-        j_matches = list(re.finditer(j_pattern, document_text, re.MULTILINE))
+        j_matches = self._find_j_attachments(document_text, lowered)
         
         for match in j_matches:
             attachment_num = match.group(1) if match.group(1) else "1"
@@ -269,70 +417,63 @@ class ShipleyRFPChunker:
         # Sort sections by position in document
         section_matches.sort(key=lambda x: x["start"])
         
-        # Extract content between section boundaries
+        # Page break offsets, found once per document
+        page_breaks = [match.start() for match in _PAGE_BREAK_RE.finditer(document_text)] if section_matches else []
+        
+        # Each section ends at the start of the next section or end of document
         for i, section_match in enumerate(section_matches):
-            start_pos = section_match["start"]
-            
-            # Find end position (start of next section or end of document)
             if i + 1 < len(section_matches):
-                end_pos = section_matches[i + 1]["start"]
+                section_match["end"] = section_matches[i + 1]["start"]
             else:
-                end_pos = text_length
-            
-            # Extract section content
-            section_content = document_text[start_pos:end_pos].strip()
-            
-            # Estimate page number (rough approximation)
-            chars_before = len(document_text[:start_pos])
-            estimated_page = max(1, chars_before // 2000)  # ~2000 chars per page estimate
-            
-            # Create RFPSection object
-            rfp_section = RFPSection(
-                section_id=section_match["section_id"],
-                section_title=section_match["title"],
-                content=section_content,
-                start_pos=start_pos,
-                end_pos=end_pos,
-                page_number=estimated_page
-            )
+                section_match["end"] = text_length
             
-            # Identify subsections within this section
-            rfp_section.subsections = self._identify_subsections(section_content, section_match["section_id"])
-            
-            sections.append(rfp_section)
+            if page_breaks:
+                # Page = number of page breaks before the section header + 1
+                section_match["page_number"] = bisect_right(page_breaks, section_match["start"]) + 1
+            else:
+                # No page markers: rough approximation at ~2000 chars per page
+                section_match["page_number"] = max(1, section_match["start"] // 2000)
         
-        logger.info(f"Identified {len(sections)} RFP sections: {[s.section_id for s in sections]}")
-        return sections
+        return section_matches
+    
+    def _build_section(self, document_text: str, section_match: Dict[str, Any]) -> RFPSection:
+        """Extract one section's content and subsections from a _find_section_matches entry"""
+        start_pos = section_match["start"]
+        end_pos = section_match["end"]
+        
+        # Extract section content
+        section_content = document_text[start_pos:end_pos].strip()
+        
+        # Create RFPSection object
+        rfp_section = RFPSection(
+            section_id=section_match["section_id"],
+            section_title=section_match["title"],
+            content=section_content,
+            start_pos=start_pos,
+            end_pos=end_pos,
+            page_number=section_match["page_number"]
+        )
+        
+        # Identify subsections within this section
+        rfp_section.subsections = self._identify_subsections(section_content, section_match["section_id"])
+        
+        return rfp_section
     
     def _identify_subsections(self, section_content: str, parent_section_id: str) -> List[RFPSubsection]:
         """Identify subsections within a major section"""
         subsections = []
         
-        # Common subsection patterns
-        subsection_patterns = [
-            rf"(?i)^{parent_section_id}\.(\d+(?:\.\d+)*)\s+(.+?)(?:\n|\r|$)",  # A.1, A.1.1, etc.
-            rf"(?i)^(\d+(?:\.\d+)*)\s+(.+?)(?:\n|\r|$)",  # 1.1, 1.1.1, etc.
-            rf"(?i)^{parent_section_id}\.([a-z]+)\s+(.+?)(?:\n|\r|$)",  # A.a, A.b, etc.
-            rf"(?i)^\(([a-z\d]+)\)\s+(.+?)(?:\n|\r|$)"  # (a), (1), etc.
-        ]
-        
-        for pattern in subsection_patterns:
-            matches = list(re.finditer(pattern, section_content, re.MULTILINE))
-            
-            for match in matches:
+        for pattern_matches in self._find_subsection_matches(section_content, parent_section_id):
+            for i, match in enumerate(pattern_matches):
                 subsection_num = match.group(1)
                 subsection_title = match.group(2).strip() if len(match.groups()) > 1 else ""
                 
                 subsection_id = f"{parent_section_id}.{subsection_num}"
                 
-                # Find subsection content (until next subsection or end)
+                # Find subsection content (until next subsection or end).
+                # Matches are in document order, so the next one is the boundary.
                 start_pos = match.start()
-                end_pos = len(section_content)  # Default to end of section
-                
-                # Look for next subsection to determine end
-                remaining_matches = [m for m in matches if m.start() > start_pos]
-                if remaining_matches:
-                    end_pos = remaining_matches[0].start()
+                end_pos = pattern_matches[i + 1].start() if i + 1 < len(pattern_matches) else len(section_content)
                 
                 subsection_content = section_content[start_pos:end_pos].strip()
                 
@@ -352,128 +493,227 @@ class ShipleyRFPChunker:
         
         return subsections
     
+    def _find_subsection_matches(self, section_content: str, parent_section_id: str) -> List[List[re.Match]]:
+        """
+        Matches of each subsection pattern, in pattern order, from one scan of the section
+        
+        The patterns begin with disjoint prefixes ("C.<digit>", "<digit>", "C.<letter>",
+        "("), so a single unioned prefix scan tags each candidate line with the one
+        pattern that could match there; that pattern is then anchored at the line.
+        Skipping candidates inside a pattern's previous match keeps each list equal
+        to that pattern's own finditer (titles may follow the number on a later line).
+        """
+        prefix_regex, regexes = self._get_subsection_regexes(parent_section_id)
+        matches: List[List[re.Match]] = [[] for _ in regexes]
+        resume_at = [0] * len(regexes)
+        
+        for candidate in prefix_regex.finditer(section_content):
+            index = int(candidate.lastgroup[1:])
+            pos = candidate.start()
+            if pos < resume_at[index]:
+                continue
+            match = regexes[index].match(section_content, pos)
+            if match:
+                matches[index].append(match)
+                resume_at[index] = match.end()
+        
+        return matches
+    
+    def _find_j_attachments(self, document_text: str, lowered: Optional[str] = None) -> List[re.Match]:
+        """
+        Find J attachment headers, trying the pattern only where its literal prefix occurs
+        
+        Every match starts with "attachment" or "exhibit", so for ASCII text those
+        offsets are located with str.find on the lowercased text and the pattern is
+        anchored there, giving the same matches as finditer over the whole document.
+        Non-ASCII text (where lowercasing can change offsets) uses plain finditer.
+        lowered may pass in an already lowercased copy of an ASCII document.
+        """
+        j_regex, _ = self._section_regexes["J_ATTACHMENT"]
+        if not document_text.isascii():
+            return list(j_regex.finditer(document_text))
+        
+        if lowered is None:
+            lowered = document_text.lower()
+        candidates = []
+        for literal in ("attachment", "exhibit"):
+            pos = lowered.find(literal)
+            while pos != -1:
+                candidates.append(pos)
+                pos = lowered.find(literal, pos + 1)
+        candidates.sort()
+        
+        matches = []
+        resume_at = 0  # finditer does not return overlapping matches
+        for pos in candidates:
+            if pos < resume_at:
+                continue
+            match = j_regex.match(document_text, pos)
+            if match:
+                matches.append(match)
+                resume_at = match.end()
+        return matches
+    
+    def _get_subsection_regexes(self, parent_section_id: str) -> Tuple[re.Pattern, List[re.Pattern]]:
+        """Compiled subsection prefix union and patterns for a parent section, cached per section id"""
+        cached = self._subsection_regex_cache.get(parent_section_id)
+        if cached is None:
+            # Common subsection patterns. Titles use [^\n][^\r\n]* (the exact span the
+            # old lazy (.+?) produced) so each line is consumed greedily with no backtracking.
+            subsection_patterns = [
+                rf"(?i)^{parent_section_id}\.(\d+(?:\.\d+)*)\s+([^\n][^\r\n]*)(?:\n|\r|$)",  # A.1, A.1.1, etc.
+                rf"(?i)^(\d+(?:\.\d+)*)\s+([^\n][^\r\n]*)(?:\n|\r|$)",  # 1.1, 1.1.1, etc.
+                rf"(?i)^{parent_section_id}\.([a-z]+)\s+([^\n][^\r\n]*)(?:\n|\r|$)",  # A.a, A.b, etc.
+                rf"(?i)^\(([a-z\d]+)\)\s+([^\n][^\r\n]*)(?:\n|\r|$)"  # (a), (1), etc.
+            ]
+            # Distinguishing prefix of each pattern above, as named group p<index>
+            prefixes = [rf"{parent_section_id}\.\d", r"\d", rf"{parent_section_id}\.[a-z]", r"\("]
+            prefix_regex = re.compile(
+                "^(?:" + "|".join(f"(?P<p{i}>{prefix})" for i, prefix in enumerate(prefixes)) + ")",
+                re.IGNORECASE | re.MULTILINE
+            )
+            cached = (prefix_regex, [re.compile(pattern, re.MULTILINE) for pattern in subsection_patterns])
+            self._subsection_regex_cache[parent_section_id] = cached
+        return cached
+    
     def create_contextual_chunks(self, sections: List[RFPSection], max_chunk_size: int = 2000) -> List[ContextualChunk]:
         """
         Create contextual chunks from identified RFP sections
         
         Preserves section context while maintaining optimal chunk sizes for LightRAG.
         Uses requirement-based splitting for sections with high requirement density.
+        Sections are chunked independently, in worker processes for large documents;
+        chunk ids and order are assigned here in document order.
+        """
+        section_results = self._chunk_sections(sections, max_chunk_size)
+        return self._number_chunks(section_results, len(sections))
+    
+    def _number_chunks(self, section_results: Iterable[List[ContextualChunk]], section_count: int) -> List[ContextualChunk]:
+        """Flatten per-section chunk lists, assigning chunk ids and order in document order"""
+        chunks = []
+        for chunk_counter, chunk in enumerate(chunk for result in section_results for chunk in result):
+            chunk.chunk_id = f"chunk_{chunk_counter:04d}"
+            chunk.chunk_order = chunk_counter
+            chunks.append(chunk)
+        
+        logger.info(f"Created {len(chunks)} contextual chunks from {section_count} sections")
+        return chunks
+    
+    def _use_section_pool(self, section_count: int, total_chars: int) -> bool:
+        """Whether a document is large enough to chunk its sections in worker processes"""
+        return CHUNK_WORKERS > 1 and section_count > 1 and total_chars >= PARALLEL_CHUNKING_MIN_CHARS
+    
+    def _chunk_sections(self, sections: List[RFPSection], max_chunk_size: int) -> List[List[ContextualChunk]]:
+        """Chunk each section, fanning out to worker processes for large documents"""
+        if self._use_section_pool(len(sections), sum(len(section.content) for section in sections)):
+            try:
+                return list(_section_pool().map(_chunk_section_in_worker, sections, repeat(max_chunk_size)))
+            except Exception as e:
+                logger.warning(f"⚠️ Parallel section chunking failed, chunking in-process: {e}")
+        
+        return [self.chunk_section(section, max_chunk_size) for section in sections]
+    
+    def chunk_section(self, section: RFPSection, max_chunk_size: int = 2000) -> List[ContextualChunk]:
+        """
+        Create the chunks for a single section
+        
+        Chunk ids and order are left for create_contextual_chunks to assign.
         """
         chunks = []
-        chunk_counter = 0
+        # Whole-subsection chunks get their requirements in one fused scan at the end
+        subsection_chunks = []
         
-        for section in sections:
-            # Determine relationships for this section
-            relationships = self.relationship_mappings.get(section.section_id.split('-')[0], [])
+        # Determine relationships for this section
+        relationships = self.relationship_mappings.get(_base_section(section.section_id), [])
+        
+        # Check if section has high requirement density (>5 requirements)
+        requirement_positions = self._locate_requirements(section.content)
+        requirements = [req for _, req in requirement_positions]
+        use_requirement_splitting = len(requirements) > 5
+        
+        if use_requirement_splitting:
+            # Use requirement-based splitting for high-density sections
+            # (split_by_requirements logs the split)
+            req_chunks = self.split_by_requirements(
+                content=section.content,
+                section_id=section.section_id,
+                section_title=section.section_title,
+                subsection_id=None,
+                max_requirements_per_chunk=3,
+                requirement_positions=requirement_positions
+            )
             
-            # Check if section has high requirement density (>5 requirements)
-            requirements = self._extract_requirements(section.content)
-            use_requirement_splitting = len(requirements) > 5
+            for req_chunk in req_chunks:
+                req_chunk.page_number = section.page_number
+            
+            return req_chunks  # Skip normal processing for this section
+        
+        # Handle sections by size (existing logic)
+        if len(section.content) <= max_chunk_size:
+            # Small section - single chunk
+            chunk = ContextualChunk(
+                chunk_id="",  # Will be set by caller
+                content=section.content,
+                section_id=section.section_id,
+                section_title=section.section_title,
+                chunk_order=0,  # Will be set by caller
+                relationships=relationships,
+                page_number=section.page_number,
+                metadata={
+                    "section_type": "complete_section",
+                    "subsection_count": len(section.subsections),
+                    # Any extracted requirement implies a requirement keyword
+                    "has_requirements": bool(requirements) or self._has_requirements(section.content)
+                }
+            )
+            
+            # Identify requirements in this chunk
+            chunk.requirements = requirements
+            
+            chunks.append(chunk)
+            
+        else:
+            # Large section - split by subsections or intelligently
+            if section.subsections:
+                # Split by subsections
+                for subsection in section.subsections:
+                    if len(subsection.content) <= max_chunk_size:
+                        chunk = ContextualChunk(
+                            chunk_id="",  # Will be set by caller
+                            content=subsection.content,
+                            section_id=section.section_id,
+                            section_title=section.section_title,
+                            subsection_id=subsection.subsection_id,
+                            chunk_order=0,  # Will be set by caller
+                            relationships=relationships,
+                            page_number=section.page_number,
+                            metadata={
+                                "section_type": "subsection",
+                                "subsection_title": subsection.title,
+                                "has_requirements": False  # Set by _fill_requirements below
+                            }
+                        )
+                        
+                        subsection_chunks.append(chunk)
+                        chunks.append(chunk)
+                    else:
+                        # Very large subsection - split further
+                        chunks.extend(self._split_large_content(
+                            subsection.content, max_chunk_size, 
+                            section.section_id, section.section_title,
+                            subsection.subsection_id, relationships,
+                            section.page_number
+                        ))
             
-            if use_requirement_splitting:
-                # Use requirement-based splitting for high-density sections
-                logger.info(
-                    f"🔍 Section {section.section_id} has {len(requirements)} requirements - "
-                    f"using requirement-based splitting"
-                )
-                
-                req_chunks = self.split_by_requirements(
-                    content=section.content,
-                    section_id=section.section_id,
-                    section_title=section.section_title,
-                    subsection_id=None,
-                    max_requirements_per_chunk=3
-                )
-                
-                # Assign chunk IDs and add to main chunks list
-                for req_chunk in req_chunks:
-                    req_chunk.chunk_id = f"chunk_{chunk_counter:04d}"
-                    req_chunk.chunk_order = chunk_counter
-                    req_chunk.page_number = section.page_number
-                    chunks.append(req_chunk)
-                    chunk_counter += 1
-                
-                continue  # Skip normal processing for this section
-            
-            # Handle sections by size (existing logic)
-            if len(section.content) <= max_chunk_size:
-                # Small section - single chunk
-                chunk = ContextualChunk(
-                    chunk_id=f"chunk_{chunk_counter:04d}",
-                    content=section.content,
-                    section_id=section.section_id,
-                    section_title=section.section_title,
-                    chunk_order=chunk_counter,
-                    relationships=relationships,
-                    page_number=section.page_number,
-                    metadata={
-                        "section_type": "complete_section",
-                        "subsection_count": len(section.subsections),
-                        "has_requirements": self._has_requirements(section.content)
-                    }
-                )
-                
-                # Identify requirements in this chunk
-                chunk.requirements = requirements
-                
-                chunks.append(chunk)
-                chunk_counter += 1
-                
             else:
-                # Large section - split by subsections or intelligently
-                if section.subsections:
-                    # Split by subsections
-                    for subsection in section.subsections:
-                        if len(subsection.content) <= max_chunk_size:
-                            chunk = ContextualChunk(
-                                chunk_id=f"chunk_{chunk_counter:04d}",
-                                content=subsection.content,
-                                section_id=section.section_id,
-                                section_title=section.section_title,
-                                subsection_id=subsection.subsection_id,
-                                chunk_order=chunk_counter,
-                                relationships=relationships,
-                                page_number=section.page_number,
-                                metadata={
-                                    "section_type": "subsection",
-                                    "subsection_title": subsection.title,
-                                    "has_requirements": self._has_requirements(subsection.content)
-                                }
-                            )
-                            
-                            chunk.requirements = self._extract_requirements(subsection.content)
-                            chunks.append(chunk)
-                            chunk_counter += 1
-                        else:
-                            # Very large subsection - split further
-                            sub_chunks = self._split_large_content(
-                                subsection.content, max_chunk_size, 
-                                section.section_id, section.section_title,
-                                subsection.subsection_id, relationships,
-                                section.page_number
-                            )
-                            
-                            for sub_chunk in sub_chunks:
-                                sub_chunk.chunk_id = f"chunk_{chunk_counter:04d}"
-                                sub_chunk.chunk_order = chunk_counter
-                                chunks.append(sub_chunk)
-                                chunk_counter += 1
-                
-                else:
-                    # No subsections - split by paragraphs/logical breaks
-                    section_chunks = self._split_large_content(
-                        section.content, max_chunk_size,
-                        section.section_id, section.section_title,
-                        None, relationships, section.page_number
-                    )
-                    
-                    for section_chunk in section_chunks:
-                        section_chunk.chunk_id = f"chunk_{chunk_counter:04d}"
-                        section_chunk.chunk_order = chunk_counter
-                        chunks.append(section_chunk)
-                        chunk_counter += 1
+                # No subsections - split by paragraphs/logical breaks
+                chunks.extend(self._split_large_content(
+                    section.content, max_chunk_size,
+                    section.section_id, section.section_title,
+                    None, relationships, section.page_number
+                ))
         
-        logger.info(f"Created {len(chunks)} contextual chunks from {len(sections)} sections")
+        self._fill_requirements(subsection_chunks)
         return chunks
     
     def _split_large_content(self, content: str, max_size: int, section_id: str, 
@@ -482,94 +722,132 @@ class ShipleyRFPChunker:
         """Split large content into smaller chunks while preserving context"""
         chunks = []
         
-        # Try to split by paragraphs first
-        paragraphs = re.split(r'\n\s*\n', content)
-        
-        current_chunk = ""
-        chunk_parts = []
-        
-        for paragraph in paragraphs:
-            if len(current_chunk + paragraph) <= max_size:
-                current_chunk += paragraph + "\n\n"
-                chunk_parts.append(paragraph)
-            else:
-                # Current chunk is full, save it
-                if current_chunk.strip():
-                    chunk = ContextualChunk(
-                        chunk_id="",  # Will be set by caller
-                        content=current_chunk.strip(),
-                        section_id=section_id,
-                        section_title=section_title,
-                        subsection_id=subsection_id,
-                        chunk_order=0,  # Will be set by caller
-                        relationships=relationships,
-                        page_number=page_number,
-                        metadata={
-                            "section_type": "partial_section",
-                            "paragraph_count": len(chunk_parts),
-                            "has_requirements": self._has_requirements(current_chunk)
-                        }
-                    )
-                    
-                    chunk.requirements = self._extract_requirements(current_chunk)
-                    chunks.append(chunk)
-                
-                # Start new chunk
-                current_chunk = paragraph + "\n\n"
-                chunk_parts = [paragraph]
-        
-        # Add final chunk if there's remaining content
-        if current_chunk.strip():
+        def flush(chunk_start: int, chunk_end: int, paragraph_count: int):
+            """Build a chunk from a run of paragraphs, if it holds any text"""
+            chunk_text = content[chunk_start:chunk_end].strip()
+            if not chunk_text:
+                return
             chunk = ContextualChunk(
-                chunk_id="",
-                content=current_chunk.strip(),
+                chunk_id="",  # Will be set by caller
+                content=chunk_text,
                 section_id=section_id,
                 section_title=section_title,
                 subsection_id=subsection_id,
-                chunk_order=0,
+                chunk_order=0,  # Will be set by caller
                 relationships=relationships,
                 page_number=page_number,
                 metadata={
                     "section_type": "partial_section",
-                    "paragraph_count": len(chunk_parts),
-                    "has_requirements": self._has_requirements(current_chunk)
+                    "paragraph_count": paragraph_count,
+                    "has_requirements": False  # Set by _fill_requirements below
                 }
             )
             
-            chunk.requirements = self._extract_requirements(current_chunk)
             chunks.append(chunk)
         
+        def paragraph_spans():
+            """Yield (start, end) offsets of paragraphs between blank-line separators"""
+            paragraph_start = 0
+            for separator in _PARAGRAPH_SPLIT_RE.finditer(content):
+                yield paragraph_start, separator.start()
+                paragraph_start = separator.end()
+            yield paragraph_start, len(content)
+        
+        # Track the current chunk as offsets into content and slice it once when
+        # emitted; the running length counts "\n\n" between paragraphs as before
+        chunk_start = chunk_end = 0
+        paragraph_count = 0
+        current_len = 0
+        
+        for paragraph_start, paragraph_end in paragraph_spans():
+            paragraph_len = paragraph_end - paragraph_start
+            if current_len + paragraph_len <= max_size:
+                if not paragraph_count:
+                    chunk_start = paragraph_start
+                chunk_end = paragraph_end
+                paragraph_count += 1
+                current_len += paragraph_len + 2
+            else:
+                # Current chunk is full, save it
+                flush(chunk_start, chunk_end, paragraph_count)
+                
+                # Start new chunk
+                chunk_start, chunk_end = paragraph_start, paragraph_end
+                paragraph_count = 1
+                current_len = paragraph_len + 2
+        
+        # Add final chunk if there's remaining content
+        if paragraph_count:
+            flush(chunk_start, chunk_end, paragraph_count)
+        
+        self._fill_requirements(chunks)
         return chunks
     
+    def _fill_requirements(self, chunks: List[ContextualChunk]) -> None:
+        """Set requirements and has_requirements for chunks from one fused scan of their content"""
+        # Cheap keyword search first; only chunks with requirement language get the
+        # sentence-level scan (any extracted requirement contains a keyword)
+        candidates = [chunk for chunk in chunks if self._has_requirements(chunk.content)]
+        for chunk in chunks:
+            chunk.metadata["has_requirements"] = False
+        for chunk, requirements in zip(candidates, self._extract_requirements_batch([c.content for c in candidates])):
+            chunk.requirements = requirements
+            chunk.metadata["has_requirements"] = True
+    
+    def _extract_requirements_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract requirements for many texts with a single regex pass
+        
+        Texts are joined with "." (a sentence delimiter, so no sentence spans two
+        texts) and each match is assigned back to its text by bisecting the text
+        start offsets. Results equal calling _extract_requirements on each text.
+        """
+        results: List[List[str]] = [[] for _ in texts]
+        if not texts:
+            return results
+        
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        
+        for match in self._requirement_sentence_re.finditer(".".join(texts)):
+            requirements = results[bisect_right(starts, match.start(1)) - 1]
+            if len(requirements) == 10:  # Limit to top 10 requirements per chunk
+                continue
+            clean_req = _WHITESPACE_RE.sub(' ', match.group(1)).strip()
+            if len(clean_req) > 30:  # Substantial requirement
+                requirements.append(clean_req)
+        
+        return results
+    
     def _has_requirements(self, text: str) -> bool:
         """Check if text contains requirement patterns"""
-        for pattern in self.requirement_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        return self._requirement_re.search(text) is not None
     
     def _extract_requirements(self, text: str) -> List[str]:
         """Extract requirement statements from text"""
+        return [requirement for _, requirement in self._locate_requirements(text)]
+    
+    def _locate_requirements(self, text: str) -> List[Tuple[int, str]]:
+        """Extract requirement statements with the offset where each starts in text"""
         requirements = []
+        if not self._has_requirements(text):
+            return requirements
         
-        # Split into sentences and check each for requirement patterns
-        sentences = re.split(r'[.!?]+', text)
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if len(sentence) < 20:  # Skip very short fragments
-                continue
-                
-            # Check if sentence contains requirement indicators
-            for pattern in self.requirement_patterns:
-                if re.search(pattern, sentence):
-                    # Clean up and add requirement
-                    clean_req = re.sub(r'\s+', ' ', sentence).strip()
-                    if clean_req and len(clean_req) > 30:  # Substantial requirement
-                        requirements.append(clean_req)
+        # Only sentences containing a requirement indicator are matched
+        for match in self._requirement_sentence_re.finditer(text):
+            sentence = match.group(1)
+            # Clean up and add requirement
+            clean_req = _WHITESPACE_RE.sub(' ', sentence).strip()
+            if len(clean_req) > 30:  # Substantial requirement
+                leading_space = len(sentence) - len(sentence.lstrip())
+                requirements.append((match.start(1) + leading_space, clean_req))
+                if len(requirements) == 10:  # Limit to top 10 requirements per chunk
                     break
         
-        return requirements[:10]  # Limit to top 10 requirements per chunk
+        return requirements
     
     def split_by_requirements(
         self, 
@@ -577,7 +855,8 @@ class ShipleyRFPChunker:
         section_id: str,
         section_title: str,
         subsection_id: Optional[str] = None,
-        max_requirements_per_chunk: int = 3
+        max_requirements_per_chunk: int = 3,
+        requirement_positions: Optional[List[Tuple[int, str]]] = None
     ) -> List[ContextualChunk]:
         """
         Split content by requirements to prevent timeout and truncation issues.
@@ -596,12 +875,16 @@ class ShipleyRFPChunker:
             section_title: Section title
             subsection_id: Optional subsection identifier
             max_requirements_per_chunk: Maximum requirements per chunk (default: 3)
+            requirement_positions: Precomputed _locate_requirements(content) result,
+                if the caller already has it
         
         Returns:
             List of ContextualChunk objects with balanced requirement distribution
         """
-        # Extract all requirements from content
-        all_requirements = self._extract_requirements(content)
+        # Extract all requirements from content, with their positions in document order
+        if requirement_positions is None:
+            requirement_positions = self._locate_requirements(content)
+        all_requirements = [req for _, req in requirement_positions]
         
         # If 5 or fewer requirements, return single chunk (no splitting needed)
         if len(all_requirements) <= 5:
@@ -612,46 +895,22 @@ class ShipleyRFPChunker:
             f"splitting into chunks with max {max_requirements_per_chunk} requirements each"
         )
         
-        # Split content by locating requirement positions
+        # Split content at the requirement positions captured during extraction
         chunks = []
-        requirement_positions = []
-        
-        # Find position of each requirement in content
-        for req in all_requirements:
-            # Find first occurrence of requirement text
-            pos = content.find(req[:50])  # Match on first 50 chars for safety
-            if pos != -1:
-                requirement_positions.append((pos, req))
-        
-        # Sort by position
-        requirement_positions.sort(key=lambda x: x[0])
         
-        # Group requirements into chunks
-        req_groups = []
-        current_group = []
-        
-        for pos, req in requirement_positions:
-            current_group.append((pos, req))
-            
-            if len(current_group) >= max_requirements_per_chunk:
-                req_groups.append(current_group)
-                current_group = []
-        
-        # Add remaining requirements
-        if current_group:
-            req_groups.append(current_group)
+        # Group requirements into fixed-size chunks
+        group_size = max(1, max_requirements_per_chunk)
+        req_groups = [
+            requirement_positions[i:i + group_size]
+            for i in range(0, len(requirement_positions), group_size)
+        ]
         
-        # Create chunks based on requirement groups
-        for group_idx, req_group in enumerate(req_groups, start=1):
-            # Determine chunk boundaries
+        # Create chunks based on requirement groups; each chunk ends where the
+        # next group's first requirement starts (or at the end of content)
+        next_group_starts = [group[0][0] for group in req_groups[1:]] + [len(content)]
+        for group_idx, (req_group, end_pos) in enumerate(zip(req_groups, next_group_starts), start=1):
             start_pos = req_group[0][0]  # Start of first requirement
             
-            # Find end position (start of next group or end of content)
-            if group_idx < len(req_groups):
-                end_pos = req_groups[group_idx][0][0]  # Start of next group's first req
-            else:
-                end_pos = len(content)  # End of content
-            
             # Extract chunk content with some context before first requirement
             context_before = max(0, start_pos - 200)  # Include 200 chars before for context
             chunk_content = content[context_before:end_pos].strip()
@@ -664,7 +923,7 @@ class ShipleyRFPChunker:
                 section_title=section_title,
                 subsection_id=subsection_id,
                 chunk_order=0,  # Will be set by caller
-                relationships=self.relationship_mappings.get(section_id.split('-')[0], []),
+                relationships=self.relationship_mappings.get(_base_section(section_id), []),
                 page_number=None,  # Page estimation handled by caller
                 metadata={
                     "section_type": "requirement_split",
@@ -681,10 +940,11 @@ class ShipleyRFPChunker:
             
             chunks.append(chunk)
             
-            logger.info(
-                f"   Created requirement chunk {group_idx}/{len(req_groups)}: "
-                f"{len(req_group)} requirements, {len(chunk_content)} chars"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"   Created requirement chunk {group_idx}/{len(req_groups)}: "
+                    f"{len(req_group)} requirements, {len(chunk_content)} chars"
+                )
         
         logger.info(
             f"✅ Split section {section_id} into {len(chunks)} requirement-based chunks "
@@ -699,6 +959,18 @@ class ShipleyRFPChunker:
         
         Returns list of ContextualChunk objects ready for LightRAG processing
         """
+        chunks, _ = self.process_document_with_summary(document_text, max_chunk_size)
+        return chunks
+    
+    def process_document_with_summary(
+        self, document_text: str, max_chunk_size: int = 2000
+    ) -> Tuple[List[ContextualChunk], Dict[str, Any]]:
+        """
+        Process a document and return its chunks with their section summary
+        
+        The summary is built once here at ingest time; callers that need it
+        should use this instead of calling get_section_summary again.
+        """
         monitor = get_monitor()
         start_time = time.time()
         
@@ -708,12 +980,22 @@ class ShipleyRFPChunker:
         
         # Step 1: Identify RFP sections
         logger.info("🔍 Identifying RFP sections...")
-        sections = self.identify_sections(document_text)
-        logger.info(f"📋 Found {len(sections)} sections: {[s.section_id for s in sections]}")
+        section_matches = self._find_section_matches(document_text)
+        logger.info(f"📋 Found {len(section_matches)} sections: {[m['section_id'] for m in section_matches]}")
         
         # Step 2: Create contextual chunks
         logger.info("✂️ Creating contextual chunks...")
-        chunks = self.create_contextual_chunks(sections, max_chunk_size)
+        total_chars = sum(m["end"] - m["start"] for m in section_matches)
+        if self._use_section_pool(len(section_matches), total_chars):
+            sections = [self._build_section(document_text, m) for m in section_matches]
+            chunks = self.create_contextual_chunks(sections, max_chunk_size)
+        else:
+            # Stream: extract each section only when it is chunked, so section and
+            # subsection strings for the whole document are never held at once
+            chunks = self._number_chunks(
+                (self.chunk_section(self._build_section(document_text, m), max_chunk_size) for m in section_matches),
+                len(section_matches)
+            )
         logger.info(f"📦 Created {len(chunks)} contextual chunks")
         
         # Step 3: Enhance with cross-references
@@ -721,64 +1003,71 @@ class ShipleyRFPChunker:
         chunks = self._add_cross_references(chunks)
         
         processing_time = time.time() - start_time
-        logger.info(f"✅ RFP chunking complete: {len(chunks)} contextual chunks from {len(sections)} sections")
+        logger.info(f"✅ RFP chunking complete: {len(chunks)} contextual chunks from {len(section_matches)} sections")
         logger.info(f"⏱️ Total processing time: {processing_time:.2f}s")
         
         # Log performance summary
         section_summary = self.get_section_summary(chunks)
         logger.info(f"📊 Section summary: {section_summary['total_sections']} sections processed")
         
-        return chunks
+        return chunks, section_summary
     
     def _add_cross_references(self, chunks: List[ContextualChunk]) -> List[ContextualChunk]:
         """Add cross-references between related chunks"""
-        # Build section index
-        section_index = {}
+        # Build section index (base section -> chunk ids; J-1, J-2 etc. index under J)
+        section_index: Dict[str, List[str]] = defaultdict(list)
         for chunk in chunks:
-            section_id = chunk.section_id.split('-')[0]  # Handle J-1, J-2 etc.
-            if section_id not in section_index:
-                section_index[section_id] = []
-            section_index[section_id].append(chunk.chunk_id)
+            section_index[chunk.base_section].append(chunk.chunk_id)
+        
+        # Cross-reference target sections, checked once instead of per chunk
+        has_b = "B" in section_index
+        has_f = "F" in section_index
+        has_l = "L" in section_index
+        has_m = "M" in section_index
         
         # Enhance relationships based on actual available sections
         for chunk in chunks:
-            base_section = chunk.section_id.split('-')[0]
+            base_section = chunk.base_section
+            # Collect into a per-chunk set: chunks of a section share one relationships
+            # list (the chunker's own mapping), and the set dedupes as ids are added
+            related = set(chunk.relationships)
             
-            # Add specific cross-references based on content analysis
-            if base_section == "L" and chunk.subsection_id:
+            # Add specific cross-references based on content analysis. Target sections
+            # are checked first; cue words are searched without copying the content.
+            if base_section == "L" and has_m and chunk.subsection_id:
                 # Section L instructions often reference evaluation factors
-                if "evaluat" in chunk.content.lower() and "M" in section_index:
-                    chunk.relationships.extend(section_index["M"])
+                if _EVALUATION_CUE_RE.search(chunk.content):
+                    related.update(section_index["M"])
                     
-            elif base_section == "M" and chunk.subsection_id:
+            elif base_section == "M" and has_l and chunk.subsection_id:
                 # Section M evaluation often references instructions
-                if "instruction" in chunk.content.lower() and "L" in section_index:
-                    chunk.relationships.extend(section_index["L"])
+                if _INSTRUCTION_CUE_RE.search(chunk.content):
+                    related.update(section_index["L"])
                     
             elif base_section == "C":
                 # SOW often references CLINs and performance requirements
-                if "clin" in chunk.content.lower() and "B" in section_index:
-                    chunk.relationships.extend(section_index["B"])
-                if "performance" in chunk.content.lower() and "F" in section_index:
-                    chunk.relationships.extend(section_index["F"])
+                if has_b and _CLIN_CUE_RE.search(chunk.content):
+                    related.update(section_index["B"])
+                if has_f and _PERFORMANCE_CUE_RE.search(chunk.content):
+                    related.update(section_index["F"])
             
-            # Remove duplicates and self-references
-            chunk.relationships = list(set(chunk.relationships))
-            if chunk.chunk_id in chunk.relationships:
-                chunk.relationships.remove(chunk.chunk_id)
+            # Drop self-references; relationships stay a list for JSON metadata
+            related.discard(chunk.chunk_id)
+            chunk.relationships = list(related)
         
         return chunks
 
     def get_section_summary(self, chunks: List[ContextualChunk]) -> Dict[str, Any]:
         """Generate summary of identified sections and their relationships"""
         section_summary = {}
-        section_counts = {}
         
         for chunk in chunks:
             section_id = chunk.section_id
             
-            if section_id not in section_summary:
-                section_summary[section_id] = {
+            # One lookup per chunk; later updates go through the local reference
+            section_data = section_summary.get(section_id)
+            if section_data is None:
+                section_data = section_summary[section_id] = {
                     "title": chunk.section_title,
                     "chunk_count": 0,
                     "has_requirements": False,
@@ -788,7 +1077,6 @@ class ShipleyRFPChunker:
                 }
             
             # Update section data
-            section_data = section_summary[section_id]
             section_data["chunk_count"] += 1
             section_data["total_content_length"] += len(chunk.content)
             
@@ -800,15 +1088,42 @@ class ShipleyRFPChunker:
             
             section_data["relationships"].update(chunk.relationships)
         
-        # Convert sets to lists for JSON serialization
-        for section_data in section_summary.values():
+        # Convert sets to lists for JSON serialization, collecting sections with
+        # requirements in the same pass
+        sections_with_requirements = []
+        for section_id, section_data in section_summary.items():
             section_data["subsections"] = list(section_data["subsections"])
             section_data["relationships"] = list(section_data["relationships"])
+            if section_data["has_requirements"]:
+                sections_with_requirements.append(section_id)
         
         return {
             "sections_identified": list(section_summary.keys()),
             "total_sections": len(section_summary),
-            "total_chunks": sum(data["chunk_count"] for data in section_summary.values()),
-            "sections_with_requirements": [sid for sid, data in section_summary.items() if data["has_requirements"]],
+            "total_chunks": len(chunks),
+            "sections_with_requirements": sections_with_requirements,
             "section_details": section_summary
-        }
\ No newline at end of file
+        }
+
+
+@lru_cache(maxsize=1)
+def _section_pool() -> ProcessPoolExecutor:
+    """Process pool shared by all chunkers, created on first parallel chunking"""
+    # spawn: the server process runs threads, which fork does not copy safely
+    pool = ProcessPoolExecutor(
+        max_workers=CHUNK_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
+
+
+@lru_cache(maxsize=1)
+def _worker_chunker() -> ShipleyRFPChunker:
+    """Chunker reused by every section a worker process handles"""
+    return ShipleyRFPChunker()
+
+
+def _chunk_section_in_worker(section: RFPSection, max_chunk_size: int) -> List[ContextualChunk]:
+    """Worker-process entry point for ShipleyRFPChunker.chunk_section"""
+    return _worker_chunker().chunk_section(section, max_chunk_size)
@@ -15,16 +15,67 @@ Usage:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import multiprocessing
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from pathlib import Path
 
+from src.core import chunking
 from src.core.chunking import ShipleyRFPChunker
 
 logger = logging.getLogger(__name__)
 
+# RFP detection patterns, compiled once, each with the literal word every match
+# starts with. They match case-insensitively against the original text instead of
+# a lowercased copy; the identifier classes are [0-9\-_] because the uppercase
+# letters in the former [A-Z0-9\-_] never occurred in lowercased text.
+_RFP_PATTERNS = tuple((needle, re.compile(pattern, re.IGNORECASE)) for needle, pattern in (
+    ('solicitation', r'solicitation\s+(?:number|no\.?|#)?\s*:?\s*([0-9\-_]+)'),
+    ('rfp', r'rfp\s+(?:number|no\.?|#)?\s*:?\s*([0-9\-_]+)'),
+    ('evaluation', r'evaluation\s+factors?\s+for\s+award'),
+    ('attachment', r'attachment\s+j-?[0-9]+'),
+))
+# Detection phrases that are literal apart from the whitespace between words. The
+# single-spaced phrase is found with a plain substring search; the regex only runs
+# when the first word occurs but the phrase is split by other whitespace (line
+# breaks, double spaces).
+_RFP_PHRASES = tuple(
+    (phrase, phrase.split(' ', 1)[0], re.compile(r'\s+'.join(phrase.split()), re.IGNORECASE))
+    for phrase in (
+        'request for proposal',
+        'instructions to offerors',
+        'statement of work',
+        'performance work statement',
+        'solicitation provisions',
+        'contract clauses',
+    )
+)
+# Section mentions; group 1 is set when the mention is a header ("Section C:")
+_SECTION_MENTION_RE = re.compile(r'section\s+[a-m](\s*[\.\:])?', re.IGNORECASE)
+
+# RFP markers (cover page, table of contents, section headers) appear early, so
+# detection only reads this many leading characters (twice that to confirm a miss)
+RFP_DETECTION_WINDOW_CHARS = 200_000
+
+# Detection results for recently seen documents (reprocessing, retries), keyed by
+# the hash of the prefix detection reads so whole documents are never stored
+MAX_RFP_DETECTION_CACHE_ENTRIES = 256
+_RFP_DETECTION_CACHE: "OrderedDict[int, bool]" = OrderedDict()
+
+# Safety cap on enhanced chunk size, in tokens. This shouldn't trigger with proper
+# chunk_size settings; with qwen2.5-coder:7b's 32K token context it leaves plenty of
+# room for the entity extraction prompt + chunk content.
+MAX_CHUNK_TOKENS = 4000
+
 # Global chunk metadata mapping for progress tracking
-# Maps chunk_id -> metadata for section visibility during processing
-_CHUNK_METADATA_MAP = {}
+# Maps chunk_id -> metadata for section visibility during processing. Bounded as an
+# LRU so long-running servers do not grow it forever when nobody clears it.
+MAX_CHUNK_METADATA_ENTRIES = 100_000
+_CHUNK_METADATA_MAP: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 
 def rfp_aware_chunking_func(
     tokenizer,
@@ -63,123 +114,144 @@ def rfp_aware_chunking_func(
         ]
     """
     try:
-        logger.info(f"🔍 Starting chunking - content length: {len(content):,} chars")
-        
-        # Detect if this is an RFP document FIRST (fast check)
-        is_rfp = _detect_rfp_document(content)
-        logger.info(f"📋 RFP detection result: {is_rfp}")
+        return list(iter_chunks(
+            tokenizer,
+            content,
+            split_by_character,
+            split_by_character_only,
+            chunk_overlap_token_size,
+            chunk_token_size,
+        ))
 
-        if is_rfp:
-            logger.info("🎯 RFP document detected - using enhanced section-aware chunking")
+    except Exception as e:
+        logger.warning(f"⚠️ Enhanced chunking failed: {e}")
+        # Always fall back to standard chunking on error
+        from lightrag.operate import chunking_by_token_size
+        return chunking_by_token_size(
+            tokenizer,
+            content,
+            split_by_character,
+            split_by_character_only,
+            chunk_overlap_token_size,
+            chunk_token_size,
+        )
+
+
+def iter_chunks(
+    tokenizer,
+    content: str,
+    split_by_character: Optional[str] = None,
+    split_by_character_only: bool = False,
+    chunk_overlap_token_size: int = 100,
+    chunk_token_size: int = 1200,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield LightRAG chunk dictionaries for a document one at a time.
+
+    Streaming form of rfp_aware_chunking_func (same arguments and chunks) for
+    callers that write chunks out as they are produced instead of holding the
+    converted list. Unlike rfp_aware_chunking_func, errors propagate instead of
+    falling back to standard chunking, since earlier chunks may already be consumed.
+    """
+    # Step-by-step progress is DEBUG; each document gets a short INFO summary at the end
+    logger.debug(f"🔍 Starting chunking - content length: {len(content):,} chars")
+    
+    # Detect if this is an RFP document FIRST (fast check)
+    is_rfp = _detect_rfp_document(content)
+    logger.debug(f"📋 RFP detection result: {is_rfp}")
+
+    if is_rfp:
+        # Shared RFP chunker (patterns are compiled once per process)
+        rfp_chunker = _shared_chunker()
+
+        # Use enhanced RFP chunking
+        logger.debug("📊 Processing document with Shipley RFP methodology...")
+        rfp_chunks = rfp_chunker.process_document(content)
+        logger.debug(f"✅ RFP processing complete: {len(rfp_chunks)} chunks generated")
+
+        # Convert to LightRAG format, yielding each chunk as it is built and
+        # tallying the section summary in the same pass
+        section_counts = {}
+        requirement_split_count = 0
+        total_requirements = 0
+        total_chunks = len(rfp_chunks)
+        log_chunks = logger.isEnabledFor(logging.DEBUG)
+
+        for idx in range(1, total_chunks + 1):
+            # Drop each RFP chunk from the list as it is converted, so the original
+            # and enhanced content are not both held for the whole document
+            chunk = rfp_chunks[idx - 1]
+            rfp_chunks[idx - 1] = None
+
+            # Create enhanced content with section context (and its token count)
+            enhanced_content, tokens = _create_enhanced_chunk_content(chunk, tokenizer)
+
+            # Create metadata dict
+            chunk_metadata = {
+                'chunk_id': chunk.chunk_id,
+                'section_id': chunk.section_id,
+                'section_title': chunk.section_title,
+                'subsection_id': chunk.subsection_id,
+                'chunk_order': chunk.chunk_order,
+                'page_number': chunk.page_number,
+                'relationships': chunk.relationships,
+                'requirements_count': len(chunk.requirements),
+                'has_requirements': len(chunk.requirements) > 0,
+                'rfp_enhanced': True,
+                'document_type': 'rfp',
+                **chunk.metadata
+            }
             
-            # Initialize RFP chunker
-            logger.info("⚙️ Initializing ShipleyRFPChunker...")
-            rfp_chunker = ShipleyRFPChunker()
-            logger.info("✅ ShipleyRFPChunker initialized")
-
-            # Use enhanced RFP chunking
-            logger.info("📊 Processing document with Shipley RFP methodology...")
-            rfp_chunks = rfp_chunker.process_document(content)
-            logger.info(f"✅ RFP processing complete: {len(rfp_chunks)} chunks generated")
-
-            # Convert to LightRAG format
-            lightrag_chunks = []
-            for idx, chunk in enumerate(rfp_chunks, start=1):
-                # Create enhanced content with section context
-                enhanced_content = _create_enhanced_chunk_content(chunk)
-
-                # Create metadata dict
-                chunk_metadata = {
-                    'chunk_id': chunk.chunk_id,
-                    'section_id': chunk.section_id,
-                    'section_title': chunk.section_title,
-                    'subsection_id': chunk.subsection_id,
-                    'chunk_order': chunk.chunk_order,
-                    'page_number': chunk.page_number,
-                    'relationships': chunk.relationships,
-                    'requirements_count': len(chunk.requirements),
-                    'has_requirements': len(chunk.requirements) > 0,
-                    'rfp_enhanced': True,
-                    'document_type': 'rfp',
-                    **chunk.metadata
-                }
-                
-                # Store metadata in global map for progress tracking
-                # This allows us to log section info when LightRAG processes each chunk
-                _CHUNK_METADATA_MAP[chunk.chunk_id] = chunk_metadata
-                
-                # Log chunk creation with section visibility
+            # Store metadata in global map for progress tracking
+            # This allows us to log section info when LightRAG processes each chunk
+            _remember_chunk_metadata(chunk.chunk_id, chunk_metadata)
+            
+            # Log chunk creation with section visibility (DEBUG; the INFO summary
+            # follows the loop), building the message only when it is emitted
+            if log_chunks:
                 section_info = f"Section {chunk.section_id} - {chunk.section_title}"
                 if chunk.subsection_id:
                     section_info += f" ({chunk.subsection_id})"
-                
+
                 # Add indicator if this is a requirement-split chunk
                 split_indicator = ""
                 if chunk.metadata.get('section_type') == 'requirement_split':
                     split_indicator = f" [REQ-SPLIT {chunk.metadata.get('chunk_part', 'N/A')}]"
-                
-                logger.info(
-                    f"📝 Chunk {idx}/{len(rfp_chunks)}: {section_info}, "
+
+                logger.debug(
+                    f"📝 Chunk {idx}/{total_chunks}: {section_info}, "
                     f"Page {chunk.page_number}, {len(chunk.requirements)} reqs{split_indicator}"
                 )
 
-                chunk_dict = {
-                    'content': enhanced_content,
-                    'metadata': chunk_metadata
-                }
-                lightrag_chunks.append(chunk_dict)
+            section_counts[chunk.section_id] = section_counts.get(chunk.section_id, 0) + 1
+            total_requirements += len(chunk.requirements)
+            if chunk.metadata.get('section_type') == 'requirement_split':
+                requirement_split_count += 1
 
-            logger.info(f"✅ Enhanced chunking: {len(lightrag_chunks)} RFP-aware chunks created")
-            
-            # Log section summary with requirement-split statistics
-            section_counts = {}
-            requirement_split_count = 0
-            total_requirements = 0
-            
-            for chunk in rfp_chunks:
-                section_id = chunk.section_id
-                section_counts[section_id] = section_counts.get(section_id, 0) + 1
-                total_requirements += len(chunk.requirements)
-                
-                if chunk.metadata.get('section_type') == 'requirement_split':
-                    requirement_split_count += 1
-            
-            logger.info(f"📊 Section distribution:")
-            for section_id in sorted(section_counts.keys()):
-                count = section_counts[section_id]
-                logger.info(f"   Section {section_id}: {count} chunks")
-            
-            # Log requirement statistics
-            logger.info(f"📋 Requirement processing:")
-            logger.info(f"   Total requirements extracted: {total_requirements}")
-            logger.info(f"   Requirement-split chunks: {requirement_split_count}/{len(rfp_chunks)}")
-            
-            if requirement_split_count > 0:
-                logger.info(
-                    f"   ✅ Requirement splitting active - prevents timeout and truncation on "
-                    f"high-density sections"
-                )
-            
-            return lightrag_chunks
+            yield {
+                'tokens': tokens,
+                'content': enhanced_content,
+                'metadata': chunk_metadata
+            }
 
-        else:
-            logger.info("📄 Standard document - using default LightRAG chunking")
-            # Fall back to standard LightRAG chunking for non-RFP documents
-            from lightrag.operate import chunking_by_token_size
-            return chunking_by_token_size(
-                tokenizer,
-                content,
-                split_by_character,
-                split_by_character_only,
-                chunk_overlap_token_size,
-                chunk_token_size,
-            )
+        # Log section distribution and requirement statistics as one summary
+        section_distribution = ", ".join(
+            f"{section_id}: {count}" for section_id, count in sorted(section_counts.items())
+        )
+        logger.info(
+            f"✅ Enhanced chunking: {total_chunks} RFP-aware chunks across "
+            f"{len(section_counts)} sections ({section_distribution})"
+        )
+        logger.info(
+            f"📋 Requirement processing: {total_requirements} requirements extracted, "
+            f"{requirement_split_count}/{total_chunks} requirement-split chunks"
+        )
 
-    except Exception as e:
-        logger.warning(f"⚠️ Enhanced chunking failed: {e}")
-        # Always fall back to standard chunking on error
+    else:
+        logger.info("📄 Standard document - using default LightRAG chunking")
+        # Fall back to standard LightRAG chunking for non-RFP documents
         from lightrag.operate import chunking_by_token_size
-        return chunking_by_token_size(
+        yield from chunking_by_token_size(
             tokenizer,
             content,
             split_by_character,
@@ -189,51 +261,160 @@ def rfp_aware_chunking_func(
         )
 
 
+def chunk_batch(
+    documents: List[str],
+    tokenizer,
+    max_workers: Optional[int] = None,
+    memory_efficient: bool = False,
+    **chunking_kwargs,
+) -> Union[List[List[Dict[str, Any]]], Iterator[List[Dict[str, Any]]]]:
+    """
+    Chunk many documents in parallel worker processes.
+
+    Each document goes through rfp_aware_chunking_func in a worker; results come
+    back in input order and their chunk metadata is merged into this process's
+    chunk metadata map, so get_chunk_metadata works as after serial chunking.
+
+    Args:
+        documents: Document texts to chunk
+        tokenizer: Tokenizer passed to rfp_aware_chunking_func (must be picklable)
+        max_workers: Worker process count (default: os.cpu_count())
+        memory_efficient: If True, return an iterator yielding each document's
+            chunks as it completes instead of accumulating all of them
+        **chunking_kwargs: Remaining rfp_aware_chunking_func arguments
+
+    Returns:
+        One list of LightRAG chunk dictionaries per document
+    """
+    results = _iter_chunk_batch(documents, tokenizer, max_workers, chunking_kwargs)
+    return results if memory_efficient else list(results)
+
+
+def _iter_chunk_batch(
+    documents: List[str], tokenizer, max_workers: Optional[int], chunking_kwargs: Dict[str, Any]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Run chunk_batch's pool, yielding each document's chunks in input order"""
+    logger.info(f"📚 Batch chunking {len(documents)} documents in worker processes")
+    # spawn: callers may run threads, which fork does not copy safely
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+    ) as executor:
+        for chunks in executor.map(
+            _chunk_one, documents, repeat(tokenizer), repeat(chunking_kwargs), chunksize=1
+        ):
+            for chunk in chunks:
+                chunk_metadata = chunk.get('metadata')
+                if chunk_metadata and 'chunk_id' in chunk_metadata:
+                    _remember_chunk_metadata(chunk_metadata['chunk_id'], chunk_metadata)
+            yield chunks
+
+
+@lru_cache(maxsize=1)
+def _shared_chunker() -> ShipleyRFPChunker:
+    """Build the stateless chunker (and its compiled patterns) once per process"""
+    logger.debug("⚙️ Initializing ShipleyRFPChunker...")
+    return ShipleyRFPChunker()
+
+
+def _init_batch_worker():
+    """Keep each batch worker's section chunking in-process (the batch is the parallelism)"""
+    chunking.CHUNK_WORKERS = 1
+
+
+def _chunk_one(document: str, tokenizer, chunking_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Worker-process entry point for chunk_batch"""
+    return rfp_aware_chunking_func(tokenizer, document, **chunking_kwargs)
+
+
 def _detect_rfp_document(content: str) -> bool:
     """
     Detect if document content appears to be an RFP.
 
     Uses pattern matching similar to RFPAwareLightRAG but simplified for chunking context.
+    Only the first RFP_DETECTION_WINDOW_CHARS characters are checked; if they do not
+    look like an RFP, the first two windows are checked once more as confirmation,
+    so detection cost does not grow with document size. Results are memoized by the
+    hash of that prefix for documents that are chunked again.
+    """
+    window = RFP_DETECTION_WINDOW_CHARS
+    prefix = content[:2 * window]
+    key = hash(prefix)
+    is_rfp = _RFP_DETECTION_CACHE.get(key)
+    if is_rfp is not None:
+        _RFP_DETECTION_CACHE.move_to_end(key)
+        return is_rfp
+
+    is_rfp = _has_rfp_markers(prefix[:window]) or (
+        len(prefix) > window and _has_rfp_markers(prefix)
+    )
+    _RFP_DETECTION_CACHE[key] = is_rfp
+    while len(_RFP_DETECTION_CACHE) > MAX_RFP_DETECTION_CACHE_ENTRIES:
+        _RFP_DETECTION_CACHE.popitem(last=False)
+    return is_rfp
+
+
+def _has_rfp_markers(content: str) -> bool:
+    """
+    Score RFP indicators in text; True once the score reaches 3
+
+    For ASCII text, the literal words the patterns start with are looked up first
+    in one lowercased copy (fast substring search), and only patterns whose word
+    occurs are run as regexes; non-RFP documents usually skip every regex scan.
+    Literal phrases found single-spaced are counted without any regex.
     """
-    content_lower = content.lower()
-
-    # RFP detection patterns
-    rfp_patterns = [
-        r'solicitation\s+(?:number|no\.?|#)?\s*:?\s*([A-Z0-9\-_]+)',
-        r'rfp\s+(?:number|no\.?|#)?\s*:?\s*([A-Z0-9\-_]+)',
-        r'request\s+for\s+proposal',
-        r'section\s+[A-M]\s*[:\.]',
-        r'instructions\s+to\s+offerors',
-        r'evaluation\s+factors?\s+for\s+award',
-        r'statement\s+of\s+work',
-        r'performance\s+work\s+statement',
-        r'attachment\s+j-?[0-9]+',
-        r'solicitation\s+provisions',
-        r'contract\s+clauses',
-    ]
+    # Lowercasing non-ASCII text can diverge from IGNORECASE matching, so the
+    # literal prefilter is only used for ASCII text
+    content_lower = content.lower() if content.isascii() else None
+
+    def may_match(needle: str) -> bool:
+        return content_lower is None or needle in content_lower
 
     pattern_matches = 0
 
-    # Check content for RFP patterns
-    for pattern in rfp_patterns:
-        if __import__('re').search(pattern, content_lower):
+    # Check content for literal RFP phrases
+    for phrase, needle, pattern in _RFP_PHRASES:
+        if content_lower is not None:
+            found = content_lower.find(phrase) != -1 or (
+                needle in content_lower and pattern.search(content) is not None
+            )
+        else:
+            found = pattern.search(content) is not None
+        if found:
             pattern_matches += 1
+            if pattern_matches >= 3:
+                return True
 
-    # Check for section structure (strong indicator)
-    section_pattern = r'section\s+[a-m]\s*[\.\:]'
-    if __import__('re').search(section_pattern, content_lower):
-        pattern_matches += 2  # Weight section patterns more heavily
-
-    # Check for multiple sections
-    sections_found = len(__import__('re').findall(r'section\s+[a-m]', content_lower))
-    if sections_found >= 3:
-        pattern_matches += 3  # Strong indicator of RFP structure
+    # Check content for RFP patterns
+    for needle, pattern in _RFP_PATTERNS:
+        if may_match(needle) and pattern.search(content):
+            pattern_matches += 1
+            if pattern_matches >= 3:
+                return True
+
+    if not may_match('section'):
+        return False  # The section checks below need "section"
+
+    # One pass for both section checks: a header is a strong indicator, and so
+    # are multiple section mentions (only the first three need to be found)
+    sections_found = 0
+    header_found = False
+    for match in _SECTION_MENTION_RE.finditer(content):
+        sections_found += 1
+        if sections_found >= 3:
+            return True  # Strong indicator of RFP structure
+        if match.group(1) and not header_found:
+            header_found = True
+            pattern_matches += 2  # Weight section patterns more heavily
+            if pattern_matches >= 3:
+                return True
 
     # Require multiple pattern matches for detection
-    return pattern_matches >= 3
+    return False
 
 
-def _create_enhanced_chunk_content(chunk) -> str:
+def _create_enhanced_chunk_content(chunk, tokenizer, max_tokens: int = MAX_CHUNK_TOKENS) -> Tuple[str, int]:
     """
     Create enhanced chunk content with minimal inline context.
     
@@ -243,27 +424,25 @@ def _create_enhanced_chunk_content(chunk) -> str:
 
     Args:
         chunk: ContextualChunk from ShipleyRFPChunker
+        tokenizer: LightRAG tokenizer used to count and truncate tokens
+        max_tokens: Safety cap on the chunk's token count
 
     Returns:
-        Clean content string with minimal section context
+        Tuple of (clean content string with minimal section context, token count)
     """
     # SIMPLIFIED: Only add minimal section context
     # LightRAG's entity extraction works best with clean text
-    
-    context_prefix = f"[RFP Section {chunk.section_id}: {chunk.section_title}]\n\n"
-    
-    # Safety: Truncate extremely long chunks to prevent timeout
-    # This shouldn't happen with proper chunk_size settings, but provides safety
-    # With qwen2.5-coder:7b's 32K token context (~128K chars), we can safely use 16K chars
-    # This leaves plenty of room for entity extraction prompt + chunk content
-    MAX_CHUNK_LENGTH = 16000  # characters, not tokens (~4K tokens)
-    content = chunk.content
-    if len(content) > MAX_CHUNK_LENGTH:
-        logger.warning(f"⚠️ Chunk {chunk.chunk_id} exceeds {MAX_CHUNK_LENGTH} chars, truncating")
-        content = content[:MAX_CHUNK_LENGTH] + "\n\n[Content truncated for processing]"
-    
-    # Return clean content with minimal context
-    return context_prefix + content
+    content = f"[RFP Section {chunk.section_id}: {chunk.section_title}]\n\n{chunk.content}"
+
+    # Safety: Truncate extremely long chunks to prevent timeout. The single encode
+    # also provides the token count LightRAG expects with each chunk.
+    token_ids = tokenizer.encode(content)
+    if len(token_ids) <= max_tokens:
+        return content, len(token_ids)
+
+    logger.warning(f"⚠️ Chunk {chunk.chunk_id} exceeds {max_tokens} tokens, truncating")
+    content = tokenizer.decode(token_ids[:max_tokens]) + "\n\n[Content truncated for processing]"
+    return content, len(tokenizer.encode(content))
 
 
 def get_chunk_metadata(chunk_id: str) -> Optional[Dict[str, Any]]:
@@ -279,17 +458,31 @@ def get_chunk_metadata(chunk_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Metadata dict with section info, or None if not found
     """
-    return _CHUNK_METADATA_MAP.get(chunk_id)
+    metadata = _CHUNK_METADATA_MAP.get(chunk_id)
+    if metadata is not None:
+        try:
+            _CHUNK_METADATA_MAP.move_to_end(chunk_id)
+        except KeyError:
+            pass  # Evicted by a concurrent insert
+    return metadata
+
+
+def _remember_chunk_metadata(chunk_id: str, metadata: Dict[str, Any]):
+    """Store chunk metadata, evicting the least recently used entries past the cap"""
+    _CHUNK_METADATA_MAP[chunk_id] = metadata
+    _CHUNK_METADATA_MAP.move_to_end(chunk_id)
+    while len(_CHUNK_METADATA_MAP) > MAX_CHUNK_METADATA_ENTRIES:
+        _CHUNK_METADATA_MAP.popitem(last=False)
 
 
 def clear_chunk_metadata():
     """
     Clear the global chunk metadata mapping.
     
-    Call this between document processing runs to avoid memory buildup.
+    The mapping is bounded (MAX_CHUNK_METADATA_ENTRIES), but clearing between
+    document processing runs still keeps it to the current document.
     """
-    global _CHUNK_METADATA_MAP
-    _CHUNK_METADATA_MAP = {}
+    _CHUNK_METADATA_MAP.clear()
     logger.info("🧹 Cleared chunk metadata mapping")
 
 
@@ -302,7 +495,7 @@ def get_all_chunk_metadata() -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping chunk_id -> metadata
     """
-    return _CHUNK_METADATA_MAP.copy()
+    return dict(_CHUNK_METADATA_MAP)
 
 
 # Convenience function for testing
@@ -11,7 +11,11 @@ detecting and processing RFP documents with enhanced section-aware chunking.
 import asyncio
 import logging
 import re
-from typing import List, Dict, Any, Optional, Union
+import time
+import types
+from collections import OrderedDict, defaultdict
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
 from lightrag import LightRAG
@@ -20,9 +24,53 @@ from lightrag.utils import logger as lightrag_logger
 
 # Import RFP chunking components
 from src.core.chunking import ShipleyRFPChunker, ContextualChunk
+from src.core.lightrag_chunking import RFP_DETECTION_WINDOW_CHARS
 
 logger = logging.getLogger(__name__)
 
+# RFP detection patterns, compiled once at import, each with the literal word every
+# match starts with. They match case-insensitively against the original text, so
+# the identifier classes are [0-9\-_]: the uppercase letters in the former
+# [A-Z0-9\-_] never occurred in lowercased text (nor did a "section\s+[A-M]"
+# pattern, which is left out).
+_RFP_CONTENT_PATTERNS = tuple((needle, re.compile(pattern, re.IGNORECASE)) for needle, pattern in (
+    ('solicitation', r'solicitation\s+(?:number|no\.?|#)?\s*:?\s*([0-9\-_]+)'),
+    ('rfp', r'rfp\s+(?:number|no\.?|#)?\s*:?\s*([0-9\-_]+)'),
+    ('request', r'request\s+for\s+proposal'),
+    ('instructions', r'instructions\s+to\s+offerors'),
+    ('evaluation', r'evaluation\s+factors?\s+for\s+award'),
+    ('statement', r'statement\s+of\s+work'),
+    ('performance', r'performance\s+work\s+statement'),
+    ('attachment', r'attachment\s+j-?[0-9]+'),
+    ('solicitation', r'solicitation\s+provisions'),
+    ('contract', r'contract\s+clauses'),
+))
+# Filename indicators: plain words checked as substrings of the lowercased name,
+# and common govt solicitation number prefixes as one regex
+_RFP_FILENAME_WORDS = ('rfp', 'solicitation', 'proposal', 'sow', 'pws')
+_RFP_FILENAME_NUMBER_RE = re.compile(r'(?:n|w|gs|sp)\d+')
+# RFP query terms as one alternation (queries are short, so one search beats twelve).
+# No word boundaries: "requirements" or "clauses" must still match.
+_RFP_QUERY_RE = re.compile('|'.join((
+    r'section\s+[a-m]', r'requirement', r'compliance', r'evaluation',
+    r'proposal', r'offeror', r'solicitation', r'attachment',
+    r'instructions', r'factors', r'award', r'clause'
+)), re.IGNORECASE)
+# Analysis context appended to RFP-related queries
+_RFP_QUERY_CONTEXT = (
+    "\n\n[ANALYSIS CONTEXT: This query relates to RFP analysis. Focus on section-specific "
+    "content, requirements, compliance factors, and relationships between sections. Pay "
+    "special attention to L-M section relationships (Instructions to Offerors ↔ "
+    "Evaluation Factors).]\n"
+)
+
+# Section mentions; group 1 is set when the mention is a header ("Section C:")
+_SECTION_MENTION_RE = re.compile(r'section\s+[a-m](\s*[\.\:])?', re.IGNORECASE)
+
+# Detection results remembered per RFPAwareLightRAG instance
+MAX_DETECTION_CACHE_ENTRIES = 256
+
+
 class RFPAwareLightRAG:
     """
     Enhanced LightRAG processor with automatic RFP detection and enhanced chunking
@@ -35,32 +83,46 @@ class RFPAwareLightRAG:
     def __init__(self, lightrag_instance: LightRAG):
         """Initialize with existing LightRAG instance"""
         self.lightrag = lightrag_instance
-        self.chunker = ShipleyRFPChunker()
+        self._chunker: Optional[ShipleyRFPChunker] = None  # Built on first RFP (see chunker)
         self.rfp_chunks: List[ContextualChunk] = []
+        # Chunks by exact section id, rebuilt when rfp_chunks is replaced, and the
+        # resolved chunk lists of section id prefixes looked up since
+        self._section_index: Dict[str, List[ContextualChunk]] = {}
+        self._section_prefix_lookups: Dict[str, List[ContextualChunk]] = {}
+        self._section_index_source: Optional[List[ContextualChunk]] = None
         self.section_summary: Dict[str, Any] = {}
         self.processed_documents: Dict[str, Dict[str, Any]] = {}
+        # Queries currently running, shared by identical concurrent aquery calls
+        self._inflight_queries: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], asyncio.Future] = {}
         
-        # RFP detection patterns
-        self.rfp_patterns = [
-            r'solicitation\s+(?:number|no\.?|#)?\s*:?\s*([A-Z0-9\-_]+)',
-            r'rfp\s+(?:number|no\.?|#)?\s*:?\s*([A-Z0-9\-_]+)',
-            r'request\s+for\s+proposal',
-            r'section\s+[A-M]\s*[:\.]',
-            r'instructions\s+to\s+offerors',
-            r'evaluation\s+factors?\s+for\s+award',
-            r'statement\s+of\s+work',
-            r'performance\s+work\s+statement',
-            r'attachment\s+j-?[0-9]+',
-            r'solicitation\s+provisions',
-            r'contract\s+clauses',
-        ]
+        # RFP detection patterns (compiled at import, shared by all instances)
+        self.rfp_patterns = _RFP_CONTENT_PATTERNS
+        # Content scores of recently detected documents (retries, re-ingests), keyed by
+        # the hash of the prefix detection reads so documents are never stored
+        self._detection_cache: "OrderedDict[int, Tuple[int, int]]" = OrderedDict()
         
         lightrag_logger.info("🎯 RFP-Aware LightRAG initialized - enhanced processing ready")
     
+    @property
+    def chunker(self) -> ShipleyRFPChunker:
+        """Section-aware chunker, built on first use so non-RFP workloads skip its setup"""
+        if self._chunker is None:
+            self._chunker = ShipleyRFPChunker()
+        return self._chunker
+    
+    @chunker.setter
+    def chunker(self, chunker: ShipleyRFPChunker):
+        self._chunker = chunker
+    
     def detect_rfp_document(self, document_text: str, file_path: Optional[str] = None) -> bool:
         """
         Detect if a document is likely an RFP based on content and filename patterns
         
+        RFP markers (cover page, table of contents, section headers) appear early, so
+        only the first RFP_DETECTION_WINDOW_CHARS characters are scanned; if they do
+        not look like an RFP, the first two windows are scanned once more as
+        confirmation. Detection cost therefore does not grow with document size.
+        
         Args:
             document_text: Document content to analyze
             file_path: Optional path to the document file
@@ -68,47 +130,91 @@ class RFPAwareLightRAG:
         Returns:
             bool: True if document appears to be an RFP
         """
-        pattern_matches = 0
-        content_lower = document_text.lower()
-        
         # Check filename for RFP indicators
         if file_path:
             filename = Path(file_path).name.lower()
-            rfp_filename_patterns = [
-                r'rfp', r'solicitation', r'proposal', r'sow', r'pws',
-                r'n\d+', r'w\d+', r'gs\d+', r'sp\d+'  # Common govt solicitation numbers
-            ]
-            
-            for pattern in rfp_filename_patterns:
-                if re.search(pattern, filename):
-                    lightrag_logger.info(f"📄 RFP detected by filename pattern: {pattern}")
+            for word in _RFP_FILENAME_WORDS:
+                if word in filename:
+                    lightrag_logger.info(f"📄 RFP detected by filename pattern: {word}")
                     return True
+            number_match = _RFP_FILENAME_NUMBER_RE.search(filename)
+            if number_match:
+                lightrag_logger.info(f"📄 RFP detected by filename pattern: {number_match.group()}")
+                return True
+        
+        window = RFP_DETECTION_WINDOW_CHARS
+        prefix = document_text[:2 * window]
+        key = hash(prefix)
+        score = self._detection_cache.get(key)
+        if score is not None:
+            self._detection_cache.move_to_end(key)
+        else:
+            score = self._score_rfp_content(prefix[:window])
+            if score[0] < 3 and len(prefix) > window:
+                score = self._score_rfp_content(prefix)
+            self._detection_cache[key] = score
+            while len(self._detection_cache) > MAX_DETECTION_CACHE_ENTRIES:
+                self._detection_cache.popitem(last=False)
+        pattern_matches, sections_found = score
+        
+        # Require multiple pattern matches for content-based detection
+        is_rfp = pattern_matches >= 3
+        
+        if is_rfp:
+            lightrag_logger.info(f"📋 RFP document detected with at least {pattern_matches} pattern matches")
+        else:
+            lightrag_logger.info(f"📄 Document does not appear to be an RFP ({pattern_matches} pattern matches)")
+        
+        return is_rfp
+    
+    def _score_rfp_content(self, text: str) -> Tuple[int, int]:
+        """
+        Score RFP indicators in text; returns (pattern matches, sections found)
+        
+        Scanning stops as soon as the score is known to reach 3, so for RFP text the
+        counts are lower bounds.
+        """
+        pattern_matches = 0
+        
+        # Literal prescreen: for ASCII text, a pattern only runs if the word its
+        # matches start with occurs in one lowercased copy (fast substring search).
+        # Lowercasing non-ASCII text can diverge from IGNORECASE matching, so such
+        # text runs every pattern.
+        content_lower = text.lower() if text.isascii() else None
+        
+        def may_match(needle: str) -> bool:
+            return content_lower is None or needle in content_lower
         
         # Check content for RFP patterns
-        for pattern in self.rfp_patterns:
-            if re.search(pattern, content_lower):
+        for needle, pattern in self.rfp_patterns:
+            if may_match(needle) and pattern.search(text):
                 pattern_matches += 1
-                lightrag_logger.debug(f"🔍 RFP pattern match: {pattern}")
+                lightrag_logger.debug(f"🔍 RFP pattern match: {pattern.pattern}")
+                if pattern_matches >= 3:
+                    return pattern_matches, 0
+        
+        # One pass for both section checks: count mentions, noting whether any is a header
+        sections_found = 0
+        header_found = False
+        if may_match('section'):
+            for match in _SECTION_MENTION_RE.finditer(text):
+                sections_found += 1
+                if match.group(1):
+                    header_found = True
+                # Three sections, or a header on top of one pattern match, already
+                # reach the threshold
+                if sections_found >= 3 or (header_found and pattern_matches >= 1):
+                    break
         
         # Check for section structure (strong indicator)
-        section_pattern = r'section\s+[a-m]\s*[\.\:]'
-        if re.search(section_pattern, content_lower):
+        if header_found:
             pattern_matches += 2  # Weight section patterns more heavily
         
         # Check for multiple sections
-        sections_found = len(re.findall(r'section\s+[a-m]', content_lower))
         if sections_found >= 3:
             pattern_matches += 3  # Strong indicator of RFP structure
         
-        # Require multiple pattern matches for content-based detection
-        is_rfp = pattern_matches >= 3
-        
-        if is_rfp:
-            lightrag_logger.info(f"📋 RFP document detected with {pattern_matches} pattern matches, {sections_found} sections")
-        else:
-            lightrag_logger.info(f"📄 Document does not appear to be an RFP ({pattern_matches} pattern matches)")
-        
-        return is_rfp
+        return pattern_matches, sections_found
     
     async def ainsert(self, content: Union[str, List[str]], **kwargs) -> Any:
         """
@@ -161,7 +267,7 @@ class RFPAwareLightRAG:
             # Store metadata about this processing
             self.processed_documents[file_path] = {
                 "processing_type": "enhanced_rfp",
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": time.monotonic(),
                 "status": processing_result.get("status", "unknown"),
                 "sections_found": processing_result.get("sections_identified", []),
                 "chunks_created": processing_result.get("chunks_processed", 0)
@@ -182,7 +288,7 @@ class RFPAwareLightRAG:
             # Record the failure and fallback
             self.processed_documents[file_path] = {
                 "processing_type": "fallback_standard",
-                "timestamp": asyncio.get_event_loop().time(),
+                "timestamp": time.monotonic(),
                 "status": "enhanced_failed",
                 "error": str(e)
             }
@@ -213,32 +319,47 @@ class RFPAwareLightRAG:
             
             if has_rfp_content:
                 # Detect if query is RFP-related
-                rfp_query_patterns = [
-                    r'section\s+[a-m]', r'requirement', r'compliance', r'evaluation',
-                    r'proposal', r'offeror', r'solicitation', r'attachment',
-                    r'instructions', r'factors', r'award', r'clause'
-                ]
-                
-                is_rfp_query = any(re.search(pattern, query.lower()) for pattern in rfp_query_patterns)
+                is_rfp_query = _RFP_QUERY_RE.search(query) is not None
                 
                 if is_rfp_query:
                     # Enhance query with RFP context
-                    enhanced_query = f"""
-{query}
-
-[ANALYSIS CONTEXT: This query relates to RFP analysis. Focus on section-specific content, requirements, compliance factors, and relationships between sections. Pay special attention to L-M section relationships (Instructions to Offerors ↔ Evaluation Factors).]
-"""
+                    enhanced_query = f"\n{query}{_RFP_QUERY_CONTEXT}"
                     lightrag_logger.info("🎯 Enhanced RFP-aware query with section context")
-                    return await self.lightrag.aquery(enhanced_query, **kwargs)
+                    return await self._coalesced_query(enhanced_query, **kwargs)
             
             # Standard query processing
-            return await self.lightrag.aquery(query, **kwargs)
+            return await self._coalesced_query(query, **kwargs)
             
         except Exception as e:
             lightrag_logger.error(f"❌ Error in enhanced query: {e}")
             # Fallback to standard query
             return await self.lightrag.aquery(query, **kwargs)
         
+    async def _coalesced_query(self, query: str, **kwargs) -> Any:
+        """
+        Run a LightRAG query, sharing one call among identical concurrent queries
+        
+        Bursts of the same query (e.g. repeated section analysis from the WebUI)
+        await the call already in flight instead of each starting its own LLM
+        round trip. Streaming queries return per-caller iterators, so they always
+        get their own call.
+        """
+        param = kwargs.get("param")
+        if param is not None and getattr(param, "stream", False):
+            return await self.lightrag.aquery(query, **kwargs)
+        
+        key = (query, tuple(sorted((name, repr(value)) for name, value in kwargs.items())))
+        task = self._inflight_queries.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.lightrag.aquery(query, **kwargs))
+            self._inflight_queries[key] = task
+            task.add_done_callback(lambda _: self._inflight_queries.pop(key, None))
+        else:
+            lightrag_logger.debug("🔗 Joining identical in-flight query")
+        
+        # Shield so one caller's cancellation does not cancel the others' shared call
+        return await asyncio.shield(task)
+    
     async def process_rfp_document(self, document_text: str, file_path: Optional[str] = None) -> Dict[str, Any]:
         """
         Process RFP document using section-aware chunking
@@ -253,11 +374,8 @@ class RFPAwareLightRAG:
         logger.info("Starting RFP-aware document processing")
         
         try:
-            # Step 1: Use custom RFP chunking
-            self.rfp_chunks = self.chunker.process_document(document_text)
-            
-            # Step 2: Generate section summary
-            self.section_summary = self.chunker.get_section_summary(self.rfp_chunks)
+            # Step 1-2: Use custom RFP chunking (section summary is built during chunking)
+            self.rfp_chunks, self.section_summary = self.chunker.process_document_with_summary(document_text)
             
             # Step 3: Convert to LightRAG format and process
             lightrag_results = await self._process_chunks_with_lightrag(file_path or "rfp_document.pdf")
@@ -314,42 +432,32 @@ class RFPAwareLightRAG:
             }
             chunk_metadata.append(metadata)
         
-        # Process through LightRAG in batches to avoid memory issues
-        batch_size = 10  # Process in smaller batches
-        results = []
-        
-        for i in range(0, len(chunk_texts), batch_size):
-            batch_texts = chunk_texts[i:i + batch_size]
-            batch_metadata = chunk_metadata[i:i + batch_size]
-            
-            logger.info(f"Processing chunk batch {i//batch_size + 1}/{(len(chunk_texts)-1)//batch_size + 1}")
-            
-            # Join batch texts for LightRAG processing
-            batch_combined = "\n\n--- CHUNK SEPARATOR ---\n\n".join(batch_texts)
-            
-            try:
-                # Use LightRAG's ainsert method
-                batch_result = await self.lightrag.ainsert(batch_combined)
-                results.append({
-                    "batch": i//batch_size + 1,
-                    "chunks_processed": len(batch_texts),
-                    "result": batch_result,
-                    "metadata": batch_metadata
-                })
-                
-            except Exception as e:
-                logger.error(f"Batch processing failed for batch {i//batch_size + 1}: {e}")
-                results.append({
-                    "batch": i//batch_size + 1,
-                    "chunks_processed": len(batch_texts),
-                    "error": str(e),
-                    "metadata": batch_metadata
-                })
+        # Insert every chunk in one call, one document per chunk, so the
+        # section-aware chunks are not joined into one text and re-split.
+        # LightRAG queues the documents and processes up to max_parallel_insert
+        # of them concurrently; concurrent ainsert calls would only enqueue behind
+        # its pipeline lock. Chunk ids (chunk_0001, ...) repeat across RFPs, so
+        # LightRAG derives document ids from content instead.
+        logger.info(f"Inserting {len(chunk_texts)} RFP chunks into LightRAG")
+        try:
+            outcome = await self.lightrag.ainsert(
+                chunk_texts,
+                file_paths=[file_path] * len(chunk_texts),
+            )
+            insert_result = {"result": outcome}
+        except Exception as e:
+            logger.error(f"Chunk insertion failed: {e}")
+            insert_result = {"error": str(e)}
         
         return {
-            "batches_processed": len(results),
+            "batches_processed": 1,
             "total_chunks": len(chunk_texts),
-            "batch_results": results
+            "batch_results": [{
+                "batch": 1,
+                "chunks_processed": len(chunk_texts),
+                **insert_result,
+                "metadata": chunk_metadata
+            }]
         }
     
     def _create_enhanced_chunk_text(self, chunk: ContextualChunk) -> str:
@@ -381,16 +489,18 @@ class RFPAwareLightRAG:
         
         context_lines.append("--- CONTENT ---")
         
-        # Build enhanced text
-        enhanced_text = "\n".join(context_lines) + "\n\n" + chunk.content
+        # Build enhanced text with a single join (the blank entries give the blank lines)
+        context_lines.append("")
+        context_lines.append(chunk.content)
         
         # Add requirements section if present
         if chunk.requirements:
-            enhanced_text += "\n\n--- IDENTIFIED REQUIREMENTS ---\n"
-            for i, req in enumerate(chunk.requirements, 1):
-                enhanced_text += f"{i}. {req}\n"
+            context_lines.append("")
+            context_lines.append("--- IDENTIFIED REQUIREMENTS ---")
+            context_lines.extend(f"{i}. {req}" for i, req in enumerate(chunk.requirements, 1))
+            context_lines.append("")
         
-        return enhanced_text
+        return "\n".join(context_lines)
     
     async def _enhance_knowledge_graph_with_sections(self):
         """Add section-specific metadata to the knowledge graph"""
@@ -403,14 +513,7 @@ class RFPAwareLightRAG:
                     global_config=self.lightrag.global_config
                 )
                 
-                # Store section summary
-                await kv_storage.aset("section_summary", self.section_summary)
-                
-                # Store individual section details
-                for section_id, section_data in self.section_summary.get("section_details", {}).items():
-                    await kv_storage.aset(f"section_{section_id}", section_data)
-                
-                # Store chunk mapping
+                # Build chunk mapping
                 chunk_mapping = {}
                 for chunk in self.rfp_chunks:
                     chunk_mapping[chunk.chunk_id] = {
@@ -421,7 +524,17 @@ class RFPAwareLightRAG:
                         "requirements_count": len(chunk.requirements)
                     }
                 
-                await kv_storage.aset("chunk_section_mapping", chunk_mapping)
+                # Store section summary, individual section details and chunk mapping
+                # concurrently rather than one round trip at a time
+                writes = [
+                    kv_storage.aset("section_summary", self.section_summary),
+                    kv_storage.aset("chunk_section_mapping", chunk_mapping),
+                ]
+                writes.extend(
+                    kv_storage.aset(f"section_{section_id}", section_data)
+                    for section_id, section_data in self.section_summary.get("section_details", {}).items()
+                )
+                await asyncio.gather(*writes)
                 
                 logger.info("Enhanced knowledge graph with RFP section metadata")
                 
@@ -441,7 +554,7 @@ class RFPAwareLightRAG:
         """
         
         # Find chunks for this section
-        section_chunks = [chunk for chunk in self.rfp_chunks if chunk.section_id.startswith(section_id)]
+        section_chunks = self._chunks_for_section(section_id)
         
         if not section_chunks:
             return {
@@ -467,6 +580,7 @@ class RFPAwareLightRAG:
             )
             
             result = await self.lightrag.aquery_llm(section_query, param=query_param)
+            all_relationships, subsections, requirements_count = _aggregate_section_chunks(section_chunks)
             
             return {
                 "status": "success",
@@ -476,9 +590,9 @@ class RFPAwareLightRAG:
                 "section_title": section_chunks[0].section_title if section_chunks else "",
                 "result": result,
                 "section_metadata": {
-                    "subsections": list(set(chunk.subsection_id for chunk in section_chunks if chunk.subsection_id)),
-                    "total_requirements": sum(len(chunk.requirements) for chunk in section_chunks),
-                    "related_sections": list(set().union(*[chunk.relationships for chunk in section_chunks]))
+                    "subsections": list(subsections),
+                    "total_requirements": requirements_count,
+                    "related_sections": list(all_relationships)
                 }
             }
             
@@ -493,21 +607,13 @@ class RFPAwareLightRAG:
     async def get_section_relationships(self, section_id: str) -> Dict[str, Any]:
         """Get relationships for a specific section"""
         
-        section_chunks = [chunk for chunk in self.rfp_chunks if chunk.section_id.startswith(section_id)]
+        section_chunks = self._chunks_for_section(section_id)
         
         if not section_chunks:
             return {"error": f"Section {section_id} not found"}
         
         # Aggregate relationships
-        all_relationships = set()
-        requirements_count = 0
-        subsections = set()
-        
-        for chunk in section_chunks:
-            all_relationships.update(chunk.relationships)
-            requirements_count += len(chunk.requirements)
-            if chunk.subsection_id:
-                subsections.add(chunk.subsection_id)
+        all_relationships, subsections, requirements_count = _aggregate_section_chunks(section_chunks)
         
         return {
             "section_id": section_id,
@@ -518,6 +624,38 @@ class RFPAwareLightRAG:
             "chunk_count": len(section_chunks)
         }
     
+    def _chunks_for_section(self, section_id: str) -> List[ContextualChunk]:
+        """
+        Chunks whose section id starts with section_id, in document order
+        
+        Uses an index of chunks by exact section id, built once per set of processed
+        chunks, so a lookup scans the section ids instead of every chunk. Resolved
+        prefixes are remembered, so repeated queries for a section are a dict hit;
+        only prefixes that match something are kept, which bounds that map by the
+        section ids present.
+        """
+        if self._section_index_source is not self.rfp_chunks:
+            section_index: Dict[str, List[ContextualChunk]] = defaultdict(list)
+            for chunk in self.rfp_chunks:
+                section_index[chunk.section_id].append(chunk)
+            self._section_index = dict(section_index)
+            self._section_prefix_lookups = {}
+            self._section_index_source = self.rfp_chunks
+        
+        section_chunks = self._section_prefix_lookups.get(section_id)
+        if section_chunks is not None:
+            return section_chunks
+        
+        matching = [chunks for sid, chunks in self._section_index.items() if sid.startswith(section_id)]
+        if len(matching) == 1:
+            section_chunks = matching[0]
+        else:
+            # Several section ids (e.g. J -> J-1, J-2): restore document order
+            section_chunks = sorted((chunk for chunks in matching for chunk in chunks), key=attrgetter("chunk_order"))
+        if section_chunks:
+            self._section_prefix_lookups[section_id] = section_chunks
+        return section_chunks
+    
     def get_processing_status(self) -> Dict[str, Any]:
         """Get status of all processed documents"""
         rfp_count = sum(1 for doc in self.processed_documents.values() 
@@ -538,8 +676,37 @@ class RFPAwareLightRAG:
     
     # Delegate all other LightRAG methods
     def __getattr__(self, name):
-        """Delegate unknown methods to the underlying LightRAG instance"""
-        return getattr(self.lightrag, name)
+        """
+        Delegate unknown methods to the underlying LightRAG instance
+        
+        Bound methods are cached on the wrapper after the first lookup, so later
+        calls no longer go through this hook. Other attributes (config values,
+        storages, function fields LightRAG may reassign) are looked up every time.
+        """
+        if name == "lightrag":
+            # Not set yet (e.g. during unpickling); avoid recursing into this hook
+            raise AttributeError(name)
+        lightrag = self.lightrag
+        attr = getattr(lightrag, name)
+        if isinstance(attr, types.MethodType) and attr.__self__ is lightrag:
+            self.__dict__[name] = attr
+        return attr
+
+
+def _aggregate_section_chunks(section_chunks: List[ContextualChunk]) -> Tuple[set, set, int]:
+    """Related section ids, subsection ids and requirement count of chunks, in one pass"""
+    all_relationships = set()
+    subsections = set()
+    requirements_count = 0
+    
+    for chunk in section_chunks:
+        all_relationships.update(chunk.relationships)
+        requirements_count += len(chunk.requirements)
+        if chunk.subsection_id:
+            subsections.add(chunk.subsection_id)
+    
+    return all_relationships, subsections, requirements_count
+
 
 # Convenience function for easy integration
 async def process_rfp_with_lightrag(lightrag_instance: LightRAG, document_text: str, file_path: Optional[str] = None) -> Dict[str, Any]:
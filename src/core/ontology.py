@@ -17,8 +17,10 @@ References:
 - Shipley methodology: Structured RFP analysis
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Mapping, Set, Tuple, Optional
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 # Import existing enums from our models
@@ -89,68 +91,76 @@ class RelationshipType(str, Enum):
 # Define valid (source_entity_type, relationship_type, target_entity_type) tuples
 # This prevents O(n²) relationship explosion by constraining valid combinations
 
-VALID_RELATIONSHIPS: Dict[Tuple[str, str], List[str]] = {
+VALID_RELATIONSHIPS: Dict[Tuple[str, str], FrozenSet[str]] = {
     # SECTION relationships (from SectionRelationship model)
-    ("SECTION", "REFERENCES"): ["SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"],
-    ("SECTION", "DEPENDS_ON"): ["SECTION", "REQUIREMENT"],
-    ("SECTION", "EVALUATES"): ["SECTION", "REQUIREMENT", "CONCEPT"],
-    ("SECTION", "SUPPORTS"): ["SECTION", "REQUIREMENT"],
-    ("SECTION", "REQUIRES"): ["REQUIREMENT", "DOCUMENT", "CLAUSE"],
-    ("SECTION", "CONTAINS"): ["REQUIREMENT", "CONCEPT", "CLAUSE"],
+    ("SECTION", "REFERENCES"): frozenset({"SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"}),
+    ("SECTION", "DEPENDS_ON"): frozenset({"SECTION", "REQUIREMENT"}),
+    ("SECTION", "EVALUATES"): frozenset({"SECTION", "REQUIREMENT", "CONCEPT"}),
+    ("SECTION", "SUPPORTS"): frozenset({"SECTION", "REQUIREMENT"}),
+    ("SECTION", "REQUIRES"): frozenset({"REQUIREMENT", "DOCUMENT", "CLAUSE"}),
+    ("SECTION", "CONTAINS"): frozenset({"REQUIREMENT", "CONCEPT", "CLAUSE"}),
     
     # REQUIREMENT relationships
-    ("REQUIREMENT", "REFERENCES"): ["SECTION", "CLAUSE", "DOCUMENT", "REQUIREMENT"],
-    ("REQUIREMENT", "DEPENDS_ON"): ["REQUIREMENT", "CONCEPT", "TECHNOLOGY"],
-    ("REQUIREMENT", "REQUIRES"): ["TECHNOLOGY", "CONCEPT", "ORGANIZATION"],
-    ("REQUIREMENT", "SPECIFIES"): ["CONCEPT", "TECHNOLOGY", "EVENT"],
-    ("REQUIREMENT", "APPLIES_TO"): ["SECTION", "ORGANIZATION", "TECHNOLOGY"],
+    ("REQUIREMENT", "REFERENCES"): frozenset({"SECTION", "CLAUSE", "DOCUMENT", "REQUIREMENT"}),
+    ("REQUIREMENT", "DEPENDS_ON"): frozenset({"REQUIREMENT", "CONCEPT", "TECHNOLOGY"}),
+    ("REQUIREMENT", "REQUIRES"): frozenset({"TECHNOLOGY", "CONCEPT", "ORGANIZATION"}),
+    ("REQUIREMENT", "SPECIFIES"): frozenset({"CONCEPT", "TECHNOLOGY", "EVENT"}),
+    ("REQUIREMENT", "APPLIES_TO"): frozenset({"SECTION", "ORGANIZATION", "TECHNOLOGY"}),
     
     # ORGANIZATION relationships
-    ("ORGANIZATION", "IMPLEMENTS"): ["REQUIREMENT", "TECHNOLOGY"],
-    ("ORGANIZATION", "RESPONSIBLE_FOR"): ["REQUIREMENT", "EVENT", "CONCEPT"],
-    ("ORGANIZATION", "DELIVERS"): ["CONCEPT", "TECHNOLOGY", "DOCUMENT"],
-    ("ORGANIZATION", "PERFORMED_AT"): ["LOCATION"],
+    ("ORGANIZATION", "IMPLEMENTS"): frozenset({"REQUIREMENT", "TECHNOLOGY"}),
+    ("ORGANIZATION", "RESPONSIBLE_FOR"): frozenset({"REQUIREMENT", "EVENT", "CONCEPT"}),
+    ("ORGANIZATION", "DELIVERS"): frozenset({"CONCEPT", "TECHNOLOGY", "DOCUMENT"}),
+    ("ORGANIZATION", "PERFORMED_AT"): frozenset({"LOCATION"}),
     
     # CLAUSE relationships
-    ("CLAUSE", "APPLIES_TO"): ["SECTION", "REQUIREMENT", "ORGANIZATION"],
-    ("CLAUSE", "REFERENCES"): ["CLAUSE", "DOCUMENT", "SECTION"],
-    ("CLAUSE", "REQUIRES"): ["REQUIREMENT", "CONCEPT"],
+    ("CLAUSE", "APPLIES_TO"): frozenset({"SECTION", "REQUIREMENT", "ORGANIZATION"}),
+    ("CLAUSE", "REFERENCES"): frozenset({"CLAUSE", "DOCUMENT", "SECTION"}),
+    ("CLAUSE", "REQUIRES"): frozenset({"REQUIREMENT", "CONCEPT"}),
     
     # CONCEPT relationships (CLINs, technical concepts)
-    ("CONCEPT", "DEFINED_BY"): ["SECTION", "REQUIREMENT", "DOCUMENT"],
-    ("CONCEPT", "DEPENDS_ON"): ["CONCEPT", "TECHNOLOGY", "REQUIREMENT"],
-    ("CONCEPT", "IMPLEMENTS"): ["REQUIREMENT"],
-    ("CONCEPT", "SPECIFIES"): ["TECHNOLOGY", "EVENT"],
+    ("CONCEPT", "DEFINED_BY"): frozenset({"SECTION", "REQUIREMENT", "DOCUMENT"}),
+    ("CONCEPT", "DEPENDS_ON"): frozenset({"CONCEPT", "TECHNOLOGY", "REQUIREMENT"}),
+    ("CONCEPT", "IMPLEMENTS"): frozenset({"REQUIREMENT"}),
+    ("CONCEPT", "SPECIFIES"): frozenset({"TECHNOLOGY", "EVENT"}),
     
     # EVENT relationships (milestones, deliveries)
-    ("EVENT", "REQUIRES"): ["CONCEPT", "DOCUMENT", "TECHNOLOGY"],
-    ("EVENT", "DEPENDS_ON"): ["EVENT", "REQUIREMENT"],
-    ("EVENT", "DELIVERED_BY"): ["ORGANIZATION"],
-    ("EVENT", "PERFORMED_AT"): ["LOCATION"],
+    ("EVENT", "REQUIRES"): frozenset({"CONCEPT", "DOCUMENT", "TECHNOLOGY"}),
+    ("EVENT", "DEPENDS_ON"): frozenset({"EVENT", "REQUIREMENT"}),
+    ("EVENT", "DELIVERED_BY"): frozenset({"ORGANIZATION"}),
+    ("EVENT", "PERFORMED_AT"): frozenset({"LOCATION"}),
     
     # TECHNOLOGY relationships
-    ("TECHNOLOGY", "IMPLEMENTS"): ["REQUIREMENT", "CONCEPT"],
-    ("TECHNOLOGY", "SUPPORTS"): ["REQUIREMENT", "CONCEPT"],
-    ("TECHNOLOGY", "DEPENDS_ON"): ["TECHNOLOGY", "CONCEPT"],
+    ("TECHNOLOGY", "IMPLEMENTS"): frozenset({"REQUIREMENT", "CONCEPT"}),
+    ("TECHNOLOGY", "SUPPORTS"): frozenset({"REQUIREMENT", "CONCEPT"}),
+    ("TECHNOLOGY", "DEPENDS_ON"): frozenset({"TECHNOLOGY", "CONCEPT"}),
     
     # PERSON relationships
-    ("PERSON", "RESPONSIBLE_FOR"): ["REQUIREMENT", "EVENT", "CONCEPT"],
-    ("PERSON", "REPRESENTS"): ["ORGANIZATION"],
+    ("PERSON", "RESPONSIBLE_FOR"): frozenset({"REQUIREMENT", "EVENT", "CONCEPT"}),
+    ("PERSON", "REPRESENTS"): frozenset({"ORGANIZATION"}),
     
     # DOCUMENT relationships
-    ("DOCUMENT", "REFERENCES"): ["SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"],
-    ("DOCUMENT", "SUPPORTS"): ["SECTION", "REQUIREMENT"],
-    ("DOCUMENT", "DEFINES"): ["CONCEPT", "REQUIREMENT"],
+    ("DOCUMENT", "REFERENCES"): frozenset({"SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"}),
+    ("DOCUMENT", "SUPPORTS"): frozenset({"SECTION", "REQUIREMENT"}),
+    ("DOCUMENT", "DEFINES"): frozenset({"CONCEPT", "REQUIREMENT"}),
     
     # LOCATION relationships
-    ("LOCATION", "HOSTS"): ["EVENT", "ORGANIZATION"],
+    ("LOCATION", "HOSTS"): frozenset({"EVENT", "ORGANIZATION"}),
 }
 
+# Flattened (source, relationship, target) index so validation is one hash probe
+_VALID_TRIPLES: FrozenSet[Tuple[str, str, str]] = frozenset(
+    (source, relation, target)
+    for (source, relation), targets in VALID_RELATIONSHIPS.items()
+    for target in targets
+)
+
 
 # ============================================================================
 # VALIDATION FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1024)
 def is_valid_relationship(
     source_entity_type: str,
     relationship_type: str,
@@ -175,29 +185,29 @@ def is_valid_relationship(
         True
         >>> is_valid_relationship("PERSON", "CONTAINS", "SECTION")
         False
+    
+    Results are memoized per argument triple, so the debug log for an
+    invalid relationship is emitted only the first time it is seen.
     """
     # Normalize to uppercase for comparison
     source = source_entity_type.upper()
     target = target_entity_type.upper()
-    relation = relationship_type.lower()
-    
-    # Check if combination exists in schema
-    key = (source, relation.upper())
-    
-    if key not in VALID_RELATIONSHIPS:
-        logger.debug(f"Unknown relationship: {source} -{relation}-> {target}")
-        return False
+    relation = relationship_type.upper()
     
-    valid_targets = VALID_RELATIONSHIPS[key]
-    is_valid = target in valid_targets
+    if (source, relation, target) in _VALID_TRIPLES:
+        return True
     
-    if not is_valid:
+    # Invalid: consult the schema only to explain why
+    valid_targets = VALID_RELATIONSHIPS.get((source, relation))
+    if valid_targets is None:
+        logger.debug(f"Unknown relationship: {source} -{relation.lower()}-> {target}")
+    else:
         logger.debug(
-            f"Invalid relationship: {source} -{relation}-> {target}. "
-            f"Valid targets: {valid_targets}"
+            f"Invalid relationship: {source} -{relation.lower()}-> {target}. "
+            f"Valid targets: {sorted(valid_targets)}"
         )
     
-    return is_valid
+    return False
 
 
 def get_valid_relationships_for_entity(entity_type: str) -> Dict[str, List[str]]:
@@ -208,24 +218,28 @@ def get_valid_relationships_for_entity(entity_type: str) -> Dict[str, List[str]]
         entity_type: Entity type to query (e.g., "SECTION", "REQUIREMENT")
     
     Returns:
-        Dict mapping relationship types to valid target entity types
+        Dict mapping relationship types to sorted lists of valid target entity types
     
     Example:
         >>> get_valid_relationships_for_entity("SECTION")
         {
-            "REFERENCES": ["SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"],
-            "DEPENDS_ON": ["SECTION", "REQUIREMENT"],
+            "REFERENCES": ["CLAUSE", "DOCUMENT", "REQUIREMENT", "SECTION"],
+            "DEPENDS_ON": ["REQUIREMENT", "SECTION"],
             ...
         }
     """
-    entity = entity_type.upper()
-    result = {}
-    
-    for (source, relation), targets in VALID_RELATIONSHIPS.items():
-        if source == entity:
-            result[relation] = targets
-    
-    return result
+    relationships = _relationships_for_entity(entity_type.upper())
+    return {relation: list(targets) for relation, targets in relationships.items()}
+
+
+@lru_cache(maxsize=512)
+def _relationships_for_entity(entity: str) -> Mapping[str, Tuple[str, ...]]:
+    """Read-only relationship -> sorted targets view for a normalized entity type"""
+    return MappingProxyType({
+        relation: tuple(sorted(targets))
+        for (source, relation), targets in VALID_RELATIONSHIPS.items()
+        if source == entity
+    })
 
 
 def validate_knowledge_graph_relationship(
@@ -265,7 +279,7 @@ def validate_knowledge_graph_relationship(
         return (True, None)
     
     # Generate helpful error message
-    valid_rels = get_valid_relationships_for_entity(source_type)
+    valid_rels = _relationships_for_entity(source_type.upper())
     
     if relationship.upper() not in [r.upper() for r in valid_rels.keys()]:
         error_msg = (
@@ -273,7 +287,7 @@ def validate_knowledge_graph_relationship(
             f"Valid relationships: {list(valid_rels.keys())}"
         )
     else:
-        valid_targets = valid_rels.get(relationship.upper(), [])
+        valid_targets = list(valid_rels.get(relationship.upper(), ()))
         error_msg = (
             f"Invalid target type '{target_type}' for relationship "
             f"'{source_name}' -{relationship}-> '{target_name}'. "
@@ -298,14 +312,14 @@ def get_compatible_entity_types(entity_type: str, relationship_type: str) -> Lis
         relationship_type: Relationship type
     
     Returns:
-        List of valid target entity types
+        Sorted list of valid target entity types
     
     Example:
         >>> get_compatible_entity_types("SECTION", "REFERENCES")
-        ["SECTION", "REQUIREMENT", "CLAUSE", "DOCUMENT"]
+        ["CLAUSE", "DOCUMENT", "REQUIREMENT", "SECTION"]
     """
     key = (entity_type.upper(), relationship_type.upper())
-    return VALID_RELATIONSHIPS.get(key, [])
+    return sorted(VALID_RELATIONSHIPS.get(key, ()))
 
 
 # ============================================================================
@@ -331,6 +345,30 @@ RELATIONSHIP_IMPORTANCE: Dict[str, str] = {
 }
 
 
+def _parse_importance_key(key: str) -> Tuple[str, ...]:
+    """Split "TYPE[:ID]->TYPE[:ID]" into (type, id, type, id) or (type, type)"""
+    source, target = key.split("->")
+    source_parts, target_parts = source.split(":"), target.split(":")
+    if len(source_parts) != len(target_parts):
+        return ()  # Mixed forms never matched either lookup
+    return tuple(source_parts + target_parts)
+
+
+# RELATIONSHIP_IMPORTANCE keyed by tuples so lookups skip string formatting
+_PARSED_IMPORTANCE = {
+    _parse_importance_key(key): level for key, level in RELATIONSHIP_IMPORTANCE.items()
+}
+_SPECIFIC_IMPORTANCE: Dict[Tuple[str, ...], str] = {
+    key: level for key, level in _PARSED_IMPORTANCE.items() if len(key) == 4
+}
+_GENERAL_IMPORTANCE: Dict[Tuple[str, ...], str] = {
+    key: level for key, level in _PARSED_IMPORTANCE.items() if len(key) == 2
+}
+
+_CRITICAL_SECTION_PAIRS = frozenset({("L", "M"), ("M", "L")})
+_SOW_EVALUATION_TARGETS = frozenset({"B", "F", "M"})
+
+
 def assess_relationship_importance(
     source_type: str,
     source_id: str,
@@ -355,19 +393,17 @@ def assess_relationship_importance(
         Importance level: "critical", "important", or "informational"
     """
     # Check for specific patterns
-    key = f"{source_type}:{source_id}->{target_type}:{target_id}"
-    if key in RELATIONSHIP_IMPORTANCE:
-        return RELATIONSHIP_IMPORTANCE[key]
+    level = _SPECIFIC_IMPORTANCE.get((source_type, source_id, target_type, target_id))
+    if level is not None:
+        return level
     
     # Check for general patterns
-    general_key = f"{source_type}->{target_type}"
-    if general_key in RELATIONSHIP_IMPORTANCE:
-        return RELATIONSHIP_IMPORTANCE[general_key]
+    level = _GENERAL_IMPORTANCE.get((source_type, target_type))
+    if level is not None:
+        return level
     
     # L↔M relationships always critical
-    if source_id == "L" and target_id == "M":
-        return "critical"
-    if source_id == "M" and target_id == "L":
+    if (source_id, target_id) in _CRITICAL_SECTION_PAIRS:
         return "critical"
     
     # Section I (clauses) relationships important
@@ -375,7 +411,7 @@ def assess_relationship_importance(
         return "important"
     
     # Section C (SOW) to evaluation relationships important
-    if source_id == "C" and target_id in ["B", "F", "M"]:
+    if source_id == "C" and target_id in _SOW_EVALUATION_TARGETS:
         return "important"
     
     # Default to informational
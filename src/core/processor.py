@@ -39,11 +39,21 @@ class EnhancedRFPProcessor:
     integration and guaranteed type-safe outputs.
     """
     
-    def __init__(self, lightrag_instance: LightRAG):
-        """Initialize with LightRAG instance and PydanticAI agents"""
+    def __init__(
+        self,
+        lightrag_instance: LightRAG,
+        chunker: Optional[ShipleyRFPChunker] = None,
+        agents: Optional[RFPAnalysisAgents] = None
+    ):
+        """
+        Initialize with LightRAG instance and PydanticAI agents
+        
+        The chunker and agents hold no per-document state, so callers may pass
+        shared instances to avoid rebuilding them for every processor.
+        """
         self.lightrag = lightrag_instance
-        self.chunker = ShipleyRFPChunker()
-        self.agents = RFPAnalysisAgents()
+        self.chunker = chunker if chunker is not None else ShipleyRFPChunker()
+        self.agents = agents if agents is not None else RFPAnalysisAgents()
         
         # Processing state
         self.current_chunks: List[ContextualChunk] = []
@@ -64,8 +74,7 @@ class EnhancedRFPProcessor:
             logger.info(f"Starting enhanced RFP processing for: {file_path or 'document'}")
             
             # Step 1: Enhanced section-aware chunking
-            self.current_chunks = self.chunker.process_document(document_text)
-            section_summary = self.chunker.get_section_summary(self.current_chunks)
+            self.current_chunks, section_summary = self.chunker.process_document_with_summary(document_text)
             
             logger.info(f"Enhanced chunking complete: {len(self.current_chunks)} chunks, {section_summary['total_sections']} sections")
             
@@ -179,7 +188,7 @@ class EnhancedRFPProcessor:
         # Group chunks by section
         sections_content = {}
         for chunk in self.current_chunks:
-            section_id = chunk.section_id.split('-')[0]  # Handle J-1, J-2 etc.
+            section_id = chunk.base_section  # Handle J-1, J-2 etc.
             
             if section_id not in sections_content:
                 sections_content[section_id] = {
@@ -240,7 +249,7 @@ class EnhancedRFPProcessor:
             # Create sections content map for relationship analysis
             sections_map = {}
             for chunk in self.current_chunks:
-                section_id = chunk.section_id.split('-')[0]
+                section_id = chunk.base_section
                 if section_id not in sections_map:
                     sections_map[section_id] = ""
                 sections_map[section_id] += chunk.content[:500] + "\n"  # Sample content
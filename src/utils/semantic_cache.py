@@ -0,0 +1,183 @@
+"""
+Semantic Response Cache for RAG Queries
+
+Caches expensive LightRAG query responses keyed by (namespace, query text), with
+a semantic fallback: when a new query's embedding is close enough (cosine
+similarity above a threshold) to a cached query in the same namespace, the
+cached response is reused instead of running another multi-second LLM call.
+
+Embeddings come from the LightRAG instance's existing embedding function, so no
+extra model is loaded. Entries expire after a TTL and the cache is bounded with
+LRU eviction.
+
+Usage:
+    from src.utils.semantic_cache import SemanticCache
+
+    cache = SemanticCache(embedding_func=rag_instance.embedding_func)
+    vector = await cache.embed_one(query)
+    cached = cache.get("L", query, vector)
+    if cached is None:
+        response = await run_query(...)
+        cache.put("L", query, response, vector)
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EmbeddingFunc = Callable[[List[str]], Awaitable[Any]]
+
+
+@dataclass
+class _CacheEntry:
+    """Cached response with its normalized query embedding"""
+    value: Any
+    vector: Optional[np.ndarray]
+    stored_at: float
+
+
+class SemanticCache:
+    """
+    LRU + TTL response cache with cosine-similarity lookup per namespace
+
+    Exact (namespace, query) hits are served first; otherwise the closest cached
+    query in the same namespace is returned if its similarity meets the threshold.
+    """
+
+    def __init__(
+        self,
+        embedding_func: Optional[EmbeddingFunc] = None,
+        similarity_threshold: float = 0.92,
+        maxsize: int = 1024,
+        ttl_seconds: float = 3600.0,
+    ):
+        self.embedding_func = embedding_func
+        self.similarity_threshold = similarity_threshold
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[Tuple[str, str], _CacheEntry]" = OrderedDict()
+        self._namespace_keys: Dict[str, set] = {}
+        # Memoized query embeddings (text -> normalized vector), bounded like the entries
+        self._vectors: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    async def embed(self, texts: Sequence[str]) -> Optional[List[np.ndarray]]:
+        """
+        Embed texts in a single batched call, reusing memoized vectors
+
+        Returns normalized vectors aligned with ``texts``, or None if no
+        embedding function is configured or the embedding call fails.
+        """
+        if self.embedding_func is None or not texts:
+            return None
+
+        resolved = {text: self._vectors[text] for text in dict.fromkeys(texts) if text in self._vectors}
+        missing = [text for text in dict.fromkeys(texts) if text not in resolved]
+        if missing:
+            try:
+                raw = np.asarray(await self.embedding_func(missing), dtype=np.float32)
+            except Exception as e:
+                logger.warning(f"⚠️ Semantic cache embedding failed, using exact matches only: {e}")
+                return None
+
+            norms = np.linalg.norm(raw, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            for text, vector in zip(missing, raw / norms):
+                resolved[text] = vector
+                self._remember_vector(text, vector)
+
+        return [resolved[text] for text in texts]
+
+    async def embed_one(self, text: str) -> Optional[np.ndarray]:
+        """Embed a single query text (see ``embed``)"""
+        vectors = await self.embed([text])
+        return vectors[0] if vectors else None
+
+    def get(self, namespace: str, query: str, vector: Optional[np.ndarray] = None) -> Optional[Any]:
+        """Return a cached response for the query, or None on miss"""
+        now = time.monotonic()
+        key = (namespace, query)
+
+        entry = self._entries.get(key)
+        if entry is not None and not self._expired(entry, now):
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+        if vector is not None:
+            best_key, best_score = None, self.similarity_threshold
+            for candidate_key in tuple(self._namespace_keys.get(namespace, ())):
+                candidate = self._entries[candidate_key]
+                if self._expired(candidate, now):
+                    self._evict(candidate_key)
+                    continue
+                if candidate.vector is None:
+                    continue
+                score = float(np.dot(candidate.vector, vector))
+                if score >= best_score:
+                    best_key, best_score = candidate_key, score
+
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                self.hits += 1
+                self.semantic_hits += 1
+                logger.debug(f"Semantic cache hit for '{query}' ≈ '{best_key[1]}' ({best_score:.3f})")
+                return self._entries[best_key].value
+
+        self.misses += 1
+        return None
+
+    def put(self, namespace: str, query: str, value: Any, vector: Optional[np.ndarray] = None) -> None:
+        """Store a response, evicting the least recently used entry when full"""
+        key = (namespace, query)
+        if vector is None:
+            vector = self._vectors.get(query)
+
+        self._entries[key] = _CacheEntry(value=value, vector=vector, stored_at=time.monotonic())
+        self._entries.move_to_end(key)
+        self._namespace_keys.setdefault(namespace, set()).add(key)
+
+        while len(self._entries) > self.maxsize:
+            self._evict(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop all cached responses (memoized embeddings are kept)"""
+        self._entries.clear()
+        self._namespace_keys.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for status endpoints"""
+        return {
+            "entries": len(self._entries),
+            "embedded_queries": len(self._vectors),
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+    def _expired(self, entry: _CacheEntry, now: float) -> bool:
+        return now - entry.stored_at > self.ttl_seconds
+
+    def _evict(self, key: Tuple[str, str]) -> None:
+        self._entries.pop(key, None)
+        namespace_keys = self._namespace_keys.get(key[0])
+        if namespace_keys is not None:
+            namespace_keys.discard(key)
+            if not namespace_keys:
+                del self._namespace_keys[key[0]]
+
+    def _remember_vector(self, text: str, vector: np.ndarray) -> None:
+        self._vectors[text] = vector
+        self._vectors.move_to_end(text)
+        while len(self._vectors) > self.maxsize:
+            self._vectors.popitem(last=False)
@@ -0,0 +1,84 @@
+"""
+Unit tests for helpers in src/api/rfp_routes.py
+
+Tests:
+1. Streaming JSON object reader across read-block boundaries
+
+Run with pytest or directly: python test_rfp_routes.py
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.api.rfp_routes import _iter_json_object_items
+
+
+def _write_json_text(text: str) -> Path:
+    with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+        f.write(text)
+    return Path(f.name)
+
+
+def test_iter_json_object_items_block_boundaries():
+    """Members split at any block boundary decode whole, including numbers cut at '.' or 'e'"""
+    document = {
+        "ab": 1.5,
+        "exp": -2.5e-3,
+        "int": 12345,
+        "flag": True,
+        "none": None,
+        "text": "comma, brace } inside",
+        "nested": {"chunk_order_index": 3, "content": "Section L"},
+    }
+    for indent in (None, 2):
+        path = _write_json_text(json.dumps(document, indent=indent))
+        try:
+            for block_size in range(1, 16):
+                items = list(_iter_json_object_items(path, block_size=block_size))
+                assert dict(items) == document, f"block_size={block_size}: {items}"
+                assert [key for key, _ in items] == list(document)
+        finally:
+            path.unlink()
+
+
+def test_iter_json_object_items_rejects_malformed_input():
+    """A missing delimiter or closing brace raises instead of yielding a partial member"""
+    for text in ('{"a": 1 "b": 2}', '{"a": 1.5', '[1, 2]'):
+        path = _write_json_text(text)
+        try:
+            for block_size in (1, 3, 1 << 20):
+                try:
+                    list(_iter_json_object_items(path, block_size=block_size))
+                except ValueError:
+                    continue
+                raise AssertionError(f"{text!r} accepted with block_size={block_size}")
+        finally:
+            path.unlink()
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_iter_json_object_items_block_boundaries,
+        test_iter_json_object_items_rejects_malformed_input,
+    ]
+
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
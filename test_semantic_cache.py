@@ -0,0 +1,171 @@
+"""
+Unit tests for src/utils/semantic_cache.py
+
+Tests:
+1. Exact hits and TTL expiry
+2. LRU eviction at maxsize
+3. Semantic lookup above and below the similarity threshold
+4. Batched embedding with memoized vectors
+
+Run with pytest or directly: python test_semantic_cache.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils import semantic_cache
+from src.utils.semantic_cache import SemanticCache
+
+
+class _FakeClock:
+    """Stands in for the time module so TTL tests don't sleep"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def _with_fake_clock(test):
+    def wrapper():
+        clock = _FakeClock()
+        original_time = semantic_cache.time
+        semantic_cache.time = SimpleNamespace(monotonic=clock.monotonic)
+        try:
+            test(clock)
+        finally:
+            semantic_cache.time = original_time
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@_with_fake_clock
+def test_exact_hit_and_ttl_expiry(clock):
+    """Exact (namespace, query) hits are served until the TTL passes"""
+    cache = SemanticCache(ttl_seconds=60.0)
+    cache.put("L", "page limits", {"answer": 1})
+
+    assert cache.get("L", "page limits") == {"answer": 1}
+    assert cache.get("M", "page limits") is None
+
+    clock.now += 59.0
+    assert cache.get("L", "page limits") == {"answer": 1}
+
+    clock.now += 2.0
+    assert cache.get("L", "page limits") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+@_with_fake_clock
+def test_expired_entries_are_evicted_on_semantic_scan(clock):
+    """Expired entries found during a semantic lookup are dropped"""
+    cache = SemanticCache(ttl_seconds=10.0)
+    cache.put("L", "page limits", "old", _unit(1.0, 0.0))
+
+    clock.now += 11.0
+    assert cache.get("L", "page limit", _unit(1.0, 0.0)) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted once maxsize is exceeded"""
+    cache = SemanticCache(maxsize=2)
+    cache.put("L", "a", 1)
+    cache.put("L", "b", 2)
+
+    # Touch "a" so "b" becomes least recently used
+    assert cache.get("L", "a") == 1
+    cache.put("L", "c", 3)
+
+    assert cache.get("L", "b") is None
+    assert cache.get("L", "a") == 1
+    assert cache.get("L", "c") == 3
+    assert cache.stats()["entries"] == 2
+
+
+def test_semantic_threshold_hit_and_miss():
+    """A close query vector hits, a distant one misses, namespaces stay separate"""
+    cache = SemanticCache(similarity_threshold=0.9)
+    cache.put("L", "what are the page limits", "limits", _unit(1.0, 0.0, 0.0))
+
+    close = _unit(1.0, 0.2, 0.0)    # cosine ~0.98
+    distant = _unit(1.0, 1.0, 0.0)  # cosine ~0.71
+
+    assert cache.get("L", "page limits?", close) == "limits"
+    assert cache.get("L", "font size?", distant) is None
+    assert cache.get("M", "page limits?", close) is None
+
+    stats = cache.stats()
+    assert stats["semantic_hits"] == 1
+    assert stats["misses"] == 2
+
+
+def test_embed_batches_and_memoizes():
+    """Only unseen texts reach the embedding function; vectors come back normalized"""
+    calls = []
+
+    async def embedding_func(texts):
+        calls.append(list(texts))
+        return np.asarray([[3.0, 4.0] if text == "a" else [0.0, 2.0] for text in texts])
+
+    cache = SemanticCache(embedding_func=embedding_func)
+
+    vectors = asyncio.run(cache.embed(["a", "b", "a"]))
+    assert calls == [["a", "b"]]
+    assert np.allclose(vectors[0], [0.6, 0.8])
+    assert np.allclose(vectors[1], [0.0, 1.0])
+    assert np.allclose(vectors[2], vectors[0])
+
+    assert np.allclose(asyncio.run(cache.embed_one("b")), [0.0, 1.0])
+    assert calls == [["a", "b"]]
+
+
+def test_embed_failure_falls_back_to_exact_matches():
+    """A failing embedding call returns None instead of raising"""
+    async def embedding_func(texts):
+        raise RuntimeError("embedding service unavailable")
+
+    cache = SemanticCache(embedding_func=embedding_func)
+    assert asyncio.run(cache.embed_one("page limits")) is None
+
+
+def main():
+    """Run all tests"""
+    tests = [
+        test_exact_hit_and_ttl_expiry,
+        test_expired_entries_are_evicted_on_semantic_scan,
+        test_lru_eviction,
+        test_semantic_threshold_hit_and_miss,
+        test_embed_batches_and_memoizes,
+        test_embed_failure_falls_back_to_exact_matches,
+    ]
+
+    failures = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failures += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())